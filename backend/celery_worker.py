@@ -1,6 +1,6 @@
 """Celery worker entry point.
 
-Run with: celery -A celery_worker worker --loglevel=info
+Run with: celery -A celery_worker worker -Q celery,notification_queue,email_queue --loglevel=info
 """
 
 from src.celery_app import celery_app
@@ -0,0 +1,31 @@
+"""add_notification_idempotency_key
+
+Revision ID: add_notification_idempotency
+Revises: 1ecc890d92b6
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_notification_idempotency'
+down_revision = '1ecc890d92b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+    op.create_index(
+        'uq_notifications_user_idempotency_key',
+        'notifications',
+        ['user_id', 'idempotency_key'],
+        unique=True,
+        postgresql_where=sa.text('idempotency_key IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_notifications_user_idempotency_key', table_name='notifications')
+    op.drop_column('notifications', 'idempotency_key')
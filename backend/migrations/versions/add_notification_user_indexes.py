@@ -0,0 +1,25 @@
+"""add_notification_user_indexes
+
+Revision ID: add_notification_user_indexes
+Revises: add_notification_idempotency
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_notification_user_indexes'
+down_revision = 'add_notification_idempotency'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-user unread counts and newest-first listings
+    op.create_index('ix_notifications_user_read', 'notifications', ['user_id', 'is_read'], unique=False)
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_notifications_user_read', table_name='notifications')
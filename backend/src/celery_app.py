@@ -30,5 +30,21 @@ celery_app.conf.update(
     task_soft_time_limit=25 * 60,  # 25 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    # Notification ingestion and SMTP delivery get their own queues so a slow
+    # email backend never holds up notification writes
+    task_routes={
+        "notifications.send_notification": {"queue": "notification_queue"},
+        "notifications.send_bulk_notifications": {"queue": "notification_queue"},
+        "notifications.send_notifications_by_filter": {"queue": "notification_queue"},
+        "notifications.flush_notification_batches": {"queue": "notification_queue"},
+        "notifications.send_notification_email": {"queue": "email_queue"},
+    },
 )
 
+# Periodic tasks
+celery_app.conf.beat_schedule = {
+    "flush-notification-batches": {
+        "task": "notifications.flush_notification_batches",
+        "schedule": float(settings.notification_batch_window_seconds),
+    },
+}
@@ -40,6 +40,10 @@ class Settings(BaseSettings):
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
 
+    # Notification batching (bursty types are coalesced into one digest)
+    notification_batch_window_seconds: int = 30  # Beat interval for flushing batches
+    notification_batch_max_events: int = 50  # Flush early once a batch reaches this size
+
     # Email (SMTP)
     email_enabled: bool = False
     email_smtp_host: str = "smtp.gmail.com"
@@ -48,6 +52,8 @@ class Settings(BaseSettings):
     email_smtp_password: str = ""
     email_from_address: str = "noreply@promptshare.com"
     email_from_name: str = "PromptShare"
+    email_smtp_pool_size: int = 5  # Open SMTP connections kept per event loop
+    email_smtp_idle_timeout: int = 60  # Seconds before an idle pooled SMTP connection is dropped
     app_url: str = "http://localhost:5173"  # Frontend base URL for email links
     
     # Local Authentication
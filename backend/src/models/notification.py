@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -28,11 +28,27 @@ class Notification(Base):
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, nullable=False, default=False, index=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
+    # Celery task ID that created the row; a retried task reuses its ID
+    idempotency_key = Column(String(64), nullable=True)
 
     # Relationships
     user = relationship("User", backref="notifications")
     prompt = relationship("Prompt", backref="notifications")
 
+    __table_args__ = (
+        # Per-user unread counts and newest-first listings
+        Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # A task only ever creates one notification for its user, even when retried
+        Index(
+            "uq_notifications_user_idempotency_key",
+            "user_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=idempotency_key.isnot(None),
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of Notification."""
         return f"<Notification(id={self.id}, user_id={self.user_id}, type={self.type}, is_read={self.is_read})>"
@@ -1,6 +1,9 @@
 """Email notification service."""
 
+import asyncio
 import logging
+import time
+import weakref
 from typing import Optional
 from uuid import UUID
 
@@ -10,11 +13,124 @@ from email.mime.multipart import MIMEMultipart
 
 from src.config import settings
 from src.constants import NotificationType
-from src.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
+class _SMTPConnectionPool:
+    """
+    Authenticated SMTP connections kept open for reuse on one event loop.
+
+    Sending over a pooled connection skips the TCP, TLS and AUTH handshakes
+    that a fresh connection pays on every email.
+    """
+
+    def __init__(self, size: int, idle_timeout: float):
+        self._available = asyncio.Semaphore(size)
+        self._idle_timeout = idle_timeout
+        # (connection, time it was returned to the pool)
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    @staticmethod
+    async def _connect() -> aiosmtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        # Port 465 uses direct SSL/TLS (use_tls=True)
+        # Port 587 uses STARTTLS (start_tls=True) - upgrade from plain to TLS
+        # Port 25 is typically plain text (no encryption)
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.email_smtp_host,
+            port=settings.email_smtp_port,
+            username=settings.email_smtp_user,
+            password=settings.email_smtp_password,
+            use_tls=settings.email_smtp_port == 465,
+            start_tls=settings.email_smtp_port == 587,
+        )
+        await smtp.connect()
+        return smtp
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        """
+        Take a live idle connection, or open a new one if none is left.
+
+        Connections idle past the timeout, or that fail a NOOP, are closed
+        rather than reused.
+
+        Returns:
+            aiosmtplib.SMTP: A connected client
+        """
+        now = time.monotonic()
+        while self._idle:
+            smtp, idle_since = self._idle.pop()
+            if now - idle_since > self._idle_timeout or not smtp.is_connected:
+                smtp.close()
+                continue
+            try:
+                await smtp.noop()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+                continue
+            return smtp
+        return await self._connect()
+
+    @staticmethod
+    def _is_stale(exc: aiosmtplib.SMTPException) -> bool:
+        """Check whether a send failed because the server dropped the session."""
+        # 421: the server is closing the transmission channel
+        return isinstance(exc, aiosmtplib.SMTPServerDisconnected) or (
+            isinstance(exc, aiosmtplib.SMTPResponseException) and exc.code == 421
+        )
+
+    async def send(self, message: MIMEMultipart) -> None:
+        """
+        Send a message over an idle connection, opening one if none is free.
+
+        A connection the server has since dropped or is closing (421) is
+        replaced once and the send retried; a connection that fails
+        otherwise is discarded.
+
+        Args:
+            message: Message to send
+
+        Raises:
+            Exception: If email sending fails
+        """
+        async with self._available:
+            smtp = await self._checkout()
+            try:
+                try:
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPException as exc:
+                    if not self._is_stale(exc):
+                        raise
+                    smtp.close()
+                    smtp = await self._connect()
+                    await smtp.send_message(message)
+            except BaseException:
+                # Includes cancellation by a send timeout, which can leave the
+                # connection mid-transaction
+                smtp.close()
+                raise
+            self._idle.append((smtp, time.monotonic()))
+
+
+# SMTP connections belong to the loop that opened them, so the API server
+# and the Celery email loop each keep their own pool
+_smtp_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SMTPConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _smtp_pool() -> _SMTPConnectionPool:
+    """Get the SMTP connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _smtp_pools.get(loop)
+    if pool is None:
+        pool = _smtp_pools[loop] = _SMTPConnectionPool(
+            settings.email_smtp_pool_size, settings.email_smtp_idle_timeout
+        )
+    return pool
+
+
 class EmailService:
     """Service for sending email notifications."""
 
@@ -26,7 +142,7 @@ class EmailService:
         Returns:
             bool: True if email is enabled and configured
         """
-        return (
+        return bool(
             settings.email_enabled
             and settings.email_smtp_user
             and settings.email_smtp_password
@@ -34,7 +150,8 @@ class EmailService:
 
     @staticmethod
     async def send_notification_email(
-        user_id: UUID,
+        to_email: str,
+        to_name: str,
         notification_type: NotificationType,
         message: str,
         prompt_id: Optional[UUID] = None,
@@ -42,44 +159,38 @@ class EmailService:
         """
         Send an email notification to a user.
 
+        The caller looks the recipient up beforehand, so this coroutine never
+        blocks its event loop on a synchronous database query.
+
         Args:
-            user_id: ID of the user to notify
+            to_email: Recipient email address
+            to_name: Recipient full name
             notification_type: Type of notification
             message: Notification message
             prompt_id: Optional prompt ID
 
         Raises:
-            ValueError: If email is not enabled or user not found
+            ValueError: If email is not enabled
         """
         if not EmailService.is_enabled():
             raise ValueError("Email notifications are not enabled")
 
-        # Get user from database
-        from src.database import SessionLocal
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                raise ValueError(f"User {user_id} not found")
-
-            # Build email
-            subject = EmailService._get_email_subject(notification_type)
-            body = EmailService._build_email_body(
-                user=user,
-                notification_type=notification_type,
-                message=message,
-                prompt_id=prompt_id,
-            )
+        # Build email
+        subject = EmailService._get_email_subject(notification_type)
+        body = EmailService._build_email_body(
+            to_name=to_name,
+            notification_type=notification_type,
+            message=message,
+            prompt_id=prompt_id,
+        )
 
-            # Send email
-            await EmailService._send_email_async(
-                to_email=user.email,
-                to_name=user.full_name,
-                subject=subject,
-                body=body,
-            )
-        finally:
-            db.close()
+        # Send email
+        await EmailService._send_email_async(
+            to_email=to_email,
+            to_name=to_name,
+            subject=subject,
+            body=body,
+        )
 
     @staticmethod
     def _get_email_subject(notification_type: NotificationType) -> str:
@@ -101,7 +212,7 @@ class EmailService:
 
     @staticmethod
     def _build_email_body(
-        user: User,
+        to_name: str,
         notification_type: NotificationType,
         message: str,
         prompt_id: Optional[UUID] = None,
@@ -110,7 +221,7 @@ class EmailService:
         Build HTML email body.
 
         Args:
-            user: User receiving the notification
+            to_name: Full name of the user receiving the notification
             notification_type: Type of notification
             message: Notification message
             prompt_id: Optional prompt ID
@@ -141,7 +252,7 @@ class EmailService:
                     <h1>PromptShare</h1>
                 </div>
                 <div class="content">
-                    <p>Hello {user.full_name},</p>
+                    <p>Hello {to_name},</p>
                     <p>{message}</p>
         """
 
@@ -230,20 +341,5 @@ class EmailService:
         html_part = MIMEText(body, "html")
         message.attach(html_part)
 
-        # Send via SMTP
-        # Port 465 uses direct SSL/TLS (use_tls=True)
-        # Port 587 uses STARTTLS (start_tls=True) - upgrade from plain to TLS
-        # Port 25 is typically plain text (no encryption)
-        use_tls = settings.email_smtp_port == 465
-        start_tls = settings.email_smtp_port == 587
-        
-        await aiosmtplib.send(
-            message,
-            hostname=settings.email_smtp_host,
-            port=settings.email_smtp_port,
-            username=settings.email_smtp_user,
-            password=settings.email_smtp_password,
-            use_tls=use_tls,
-            start_tls=start_tls,
-        )
-
+        # Send via a pooled SMTP connection
+        await _smtp_pool().send(message)
@@ -4,6 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.constants import NotificationType
@@ -74,8 +75,9 @@ class NotificationService:
         if unread_only:
             query = query.filter(Notification.is_read == False)  # noqa: E712
 
-        # Get total count before pagination
-        total = query.count()
+        # Get total count before pagination; a bare COUNT(*) can be answered
+        # from the (user_id, is_read) index without reading the rows
+        total = query.with_entities(func.count()).scalar()
 
         # Apply ordering and pagination
         notifications = (
@@ -167,9 +169,10 @@ class NotificationService:
             int: Number of unread notifications
         """
         return (
-            db.query(Notification)
+            db.query(func.count())
+            .select_from(Notification)
             .filter(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
-            .count()
+            .scalar()
         )
 
     @staticmethod
@@ -189,20 +192,28 @@ class NotificationService:
         Raises:
             HTTPException: If notification not found or not owned by user
         """
-        notification = db.query(Notification).filter(Notification.id == notification_id).first()
-
-        if not notification:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Notification not found",
-            )
+        # Delete only if the user owns it: one round trip on the normal path
+        deleted = (
+            db.query(Notification)
+            .filter(Notification.id == notification_id, Notification.user_id == user_id)
+            .delete()
+        )
 
-        if notification.user_id != user_id:
+        if not deleted:
+            # Nothing was deleted; an EXISTS check tells a missing
+            # notification from someone else's
+            exists = db.query(
+                db.query(Notification.id).filter(Notification.id == notification_id).exists()
+            ).scalar()
+            if not exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Notification not found",
+                )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to delete this notification",
             )
 
-        db.delete(notification)
         db.commit()
 
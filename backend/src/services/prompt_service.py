@@ -4,11 +4,12 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
 
 from src.constants import NotificationType, PromptStatus, SortOrder, UserRole
 from src.models.category import Category
-from src.models.prompt import Prompt
+from src.models.prompt import Prompt, PromptCategory
 from src.models.prompt_copy_event import PromptCopyEvent
 from src.models.user import User
 from src.models.user_follow import UserFollow
@@ -69,27 +70,38 @@ class PromptService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Categories not found: {list(missing_ids)}",
                 )
-
-        # Create prompt
-        prompt = Prompt(
-            title=prompt_data.title,
-            description=prompt_data.description,
-            content=prompt_data.content,
-            platform_tags=prompt_data.platform_tags,
-            use_cases=prompt_data.use_cases,
-            usage_tips=prompt_data.usage_tips,
-            status=prompt_data.status,
-            author_id=author_id,
-            is_featured=prompt_data.is_featured if prompt_data.is_featured else False,
+        else:
+            categories = []
+
+        # Create prompt - RETURNING hands back the new ID in the INSERT round trip
+        prompt_id = db.scalar(
+            insert(Prompt)
+            .values(
+                title=prompt_data.title,
+                description=prompt_data.description,
+                content=prompt_data.content,
+                platform_tags=prompt_data.platform_tags,
+                use_cases=prompt_data.use_cases,
+                usage_tips=prompt_data.usage_tips,
+                status=prompt_data.status,
+                author_id=author_id,
+                is_featured=prompt_data.is_featured if prompt_data.is_featured else False,
+            )
+            .returning(Prompt.id)
         )
 
-        # Associate categories
-        if prompt_data.category_ids and categories:
-            prompt.categories = categories
+        # Associate categories with a single multi-row insert
+        if categories:
+            db.execute(
+                insert(PromptCategory),
+                [{"prompt_id": prompt_id, "category_id": category.id} for category in categories],
+            )
 
-        db.add(prompt)
         db.commit()
-        db.refresh(prompt)
+
+        # The commit expires the session, so load the prompt once with its
+        # author and categories rather than lazily attribute by attribute
+        prompt = PromptService._prompt_query(db).filter(Prompt.id == prompt_id).one()
 
         # Notify followers if prompt is published
         if prompt.status == PromptStatus.PUBLISHED and prompt.categories:
@@ -114,14 +126,31 @@ class PromptService:
         Returns:
             Prompt: Prompt object if found, None otherwise
         """
-        prompt = db.query(Prompt).filter(Prompt.id == prompt_id).first()
-
-        if prompt and increment_view:
-            prompt.view_count += 1
+        if increment_view:
+            # Increment in SQL so the reload below picks up the new count
+            db.query(Prompt).filter(Prompt.id == prompt_id).update(
+                {Prompt.view_count: Prompt.view_count + 1},
+                synchronize_session=False,
+            )
             db.commit()
-            db.refresh(prompt)
 
-        return prompt
+        return PromptService._prompt_query(db).filter(Prompt.id == prompt_id).first()
+
+    @staticmethod
+    def _prompt_query(db: Session) -> Query:
+        """
+        Build a prompt query with categories and author eagerly loaded.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Query: Prompt query that avoids per-prompt lazy loads
+        """
+        return db.query(Prompt).options(
+            selectinload(Prompt.categories),
+            joinedload(Prompt.author),
+        )
 
     @staticmethod
     def get_prompts(
@@ -387,32 +416,32 @@ class PromptService:
         """
         Notify all users following the prompt's categories.
 
-        Deduplicates notifications so users following multiple categories
-        only receive one notification per prompt.
+        Queues one send_notifications_by_filter_task with a filter spec for
+        the prompt's categories; the task resolves the followers, excluding
+        the author, and notifies each user once however many of the
+        categories they follow.
 
         Args:
             db: Database session
             prompt: The prompt that triggered the notification
             notification_type: Type of notification (NEW_PROMPT or UPDATE)
         """
-        from src.services.notification_service import NotificationService
-
         if not prompt.categories:
             return
 
         category_ids = [cat.id for cat in prompt.categories]
 
-        # Get all users following these categories
-        follows = (
-            db.query(UserFollow)
-            .filter(UserFollow.category_id.in_(category_ids))
-            .all()
-        )
-
-        # Deduplicate by user_id - users following multiple categories get one notification
-        unique_user_ids = {follow.user_id for follow in follows if follow.user_id != prompt.author_id}
+        # Only queue work if someone other than the author follows these categories
+        has_followers = db.query(
+            db.query(UserFollow.id)
+            .filter(
+                UserFollow.category_id.in_(category_ids),
+                UserFollow.user_id != prompt.author_id,
+            )
+            .exists()
+        ).scalar()
 
-        if not unique_user_ids:
+        if not has_followers:
             return
 
         # Create notification message
@@ -422,13 +451,16 @@ class PromptService:
             message = f"Prompt updated: {prompt.title}"
 
         # Send notifications asynchronously via Celery
-        from src.tasks.notifications import send_bulk_notifications_task
-
-        user_id_strings = [str(user_id) for user_id in unique_user_ids]
-        
-        # Queue async task for notification delivery
-        send_bulk_notifications_task.delay(
-            user_ids=user_id_strings,
+        from src.config import settings
+        from src.tasks.notifications import send_notifications_by_filter_task
+
+        # The task resolves followers itself, deduplicating users who follow
+        # several of the categories, so the message stays small for any audience
+        send_notifications_by_filter_task.delay(
+            filter_spec={
+                "category_ids": [str(category_id) for category_id in category_ids],
+                "exclude_user_ids": [str(prompt.author_id)],
+            },
             notification_type=notification_type.value,
             message=message,
             prompt_id=str(prompt.id),
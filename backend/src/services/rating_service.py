@@ -155,9 +155,15 @@ class RatingService:
         Returns:
             dict: Rating summary with average, total, and distribution
         """
-        ratings = db.query(Rating).filter(Rating.prompt_id == prompt_id).all()
+        # Aggregate in SQL: at most one row per star value
+        counts = (
+            db.query(Rating.rating, func.count(Rating.id))
+            .filter(Rating.prompt_id == prompt_id)
+            .group_by(Rating.rating)
+            .all()
+        )
 
-        if not ratings:
+        if not counts:
             return {
                 "prompt_id": prompt_id,
                 "average_rating": 0.0,
@@ -165,13 +171,15 @@ class RatingService:
                 "rating_distribution": {1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
             }
 
-        total = len(ratings)
-        average = sum(r.rating for r in ratings) / total
-
-        # Calculate distribution
+        # Derive total, average and distribution from the grouped counts
         distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        for rating in ratings:
-            distribution[rating.rating] = distribution.get(rating.rating, 0) + 1
+        total = 0
+        rating_sum = 0
+        for value, count in counts:
+            distribution[value] = count
+            total += count
+            rating_sum += value * count
+        average = rating_sum / total
 
         return {
             "prompt_id": prompt_id,
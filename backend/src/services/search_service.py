@@ -25,7 +25,8 @@ class SearchService:
         sort_by: SortOrder = SortOrder.NEWEST,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[Prompt], int]:
+        return_total: bool = True,
+    ) -> tuple[list[Prompt], Optional[int]]:
         """
         Search prompts with full-text search and filters.
 
@@ -39,9 +40,11 @@ class SearchService:
             sort_by: Sort order
             skip: Number of records to skip
             limit: Maximum number of records to return
+            return_total: Run the COUNT query; pass False on later pages when
+                the caller already knows the total
 
         Returns:
-            tuple: (list of prompts, total count)
+            tuple: (list of prompts, total count or None if return_total is False)
         """
         sql_query = db.query(Prompt)
 
@@ -87,7 +90,9 @@ class SearchService:
 
         # Get total count before pagination
         # For queries with DISTINCT (category joins), count distinct IDs
-        if category_id:
+        if not return_total:
+            total = None
+        elif category_id:
             # When using distinct with joins, count distinct IDs
             total = sql_query.with_entities(Prompt.id).distinct().count()
         else:
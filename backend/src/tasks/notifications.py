@@ -1,45 +1,372 @@
 """Celery tasks for notification delivery."""
 
 import asyncio
-from typing import Optional
-from uuid import UUID
+import concurrent.futures
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, Union
+from uuid import UUID, uuid4
 
+import aiosmtplib
+import redis
 from celery import Task
+from sqlalchemy import Select, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from src.celery_app import celery_app
+from src.config import settings
 from src.constants import NotificationType
 from src.database import SessionLocal
+from src.models.notification import Notification
+from src.models.prompt import Prompt
+from src.models.user import User
+from src.models.user_follow import UserFollow
 from src.services.email_service import EmailService
-from src.services.notification_service import NotificationService
+
+_thread_local = threading.local()
+
+# Email settings are fixed for the worker's lifetime, so check them once
+# rather than on every task
+_EMAIL_ENABLED = EmailService.is_enabled()
+
+# Seconds to wait for a single email send on the shared event loop
+EMAIL_SEND_TIMEOUT = 30
+
+_email_loop: Optional[asyncio.AbstractEventLoop] = None
+_email_loop_pid: Optional[int] = None
+_email_loop_lock = threading.Lock()
+
+# Notification type values mapped to their members, so validating a type is a
+# dict lookup rather than an Enum call
+_NOTIFICATION_TYPES = {member.value: member for member in NotificationType}
+
+# Bursty types whose emailed notifications are coalesced into one digest
+BATCHABLE_NOTIFICATION_TYPES = frozenset({NotificationType.COMMENT})
+
+# Redis keys: one sorted set of pending events per (user, type), scored by
+# enqueue time, plus a set indexing the batch keys that have pending events
+NOTIFICATION_BATCH_KEY = "notif:batch:{user_id}:{notification_type}"
+NOTIFICATION_BATCH_INDEX_KEY = "notif:batch:keys"
+
+NOTIFICATION_BATCH_LOCK_KEY = "notif:batch:flush-lock"
+
+# Claimed by the email task before sending, so a notification queued for email
+# more than once is only sent once; kept past the email task's retry window
+NOTIFICATION_EMAIL_CLAIM_KEY = "notif:email:{notification_id}"
+NOTIFICATION_EMAIL_CLAIM_TTL = 86400
+
+# Atomically remove the handled events ARGV from the batch KEYS[1], dropping
+# the batch from the index KEYS[2] once it is empty. Events are only removed
+# once written, so a failed flush leaves them for the next run.
+_ACK_BATCH_SCRIPT = """
+for i = 1, #ARGV, 1000 do
+    redis.call('ZREM', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+if redis.call('ZCARD', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], KEYS[1])
+end
+return 0
+"""
+
+
+def _session() -> Session:
+    """
+    Get the database session cached for the current worker thread.
+
+    Tasks on the same thread reuse one Session instead of building a new one
+    per invocation; each task still ends with commit/rollback and close(),
+    which returns the connection to the pool but leaves the Session reusable.
+
+    Returns:
+        Session: The thread's database session
+    """
+    db = getattr(_thread_local, "db", None)
+    if db is None:
+        db = _thread_local.db = SessionLocal()
+    return db
+
+
+def _get_email_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide event loop that email coroutines run on.
+
+    The loop runs forever on a daemon thread, started on first use. It is
+    restarted in a forked worker child, since threads do not survive fork().
+
+    Returns:
+        asyncio.AbstractEventLoop: The running shared loop
+    """
+    global _email_loop, _email_loop_pid
+    with _email_loop_lock:
+        if _email_loop is None or _email_loop_pid != os.getpid():
+            _email_loop = asyncio.new_event_loop()
+            _email_loop_pid = os.getpid()
+            threading.Thread(
+                target=_email_loop.run_forever,
+                name="notification-email-loop",
+                daemon=True,
+            ).start()
+        return _email_loop
+
+
+def _run_email(coro) -> None:
+    """
+    Run an email coroutine on the shared loop and wait for it to finish.
+
+    Args:
+        coro: Coroutine to run
+
+    Raises:
+        Exception: Whatever the coroutine raised, or TimeoutError
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_email_loop())
+    try:
+        future.result(timeout=EMAIL_SEND_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        # Stop the send on the loop so it does not finish behind a retry
+        future.cancel()
+        raise
+
+
+async def _gather_bounded(coros: list) -> list:
+    """
+    Await coroutines concurrently, at most one per pooled SMTP connection.
+
+    Each coroutine gets EMAIL_SEND_TIMEOUT once it starts, so a slow send
+    fails on its own instead of holding up the rest.
+
+    Args:
+        coros: Coroutines to await
+
+    Returns:
+        list: Each coroutine's result or raised exception, in order
+    """
+    semaphore = asyncio.Semaphore(settings.email_smtp_pool_size)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await asyncio.wait_for(coro, EMAIL_SEND_TIMEOUT)
+
+    return await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=True)
+
+
+def _run_emails(coros: list) -> list:
+    """
+    Run email coroutines concurrently on the shared loop and wait for all.
+
+    Timeouts are reported per coroutine rather than raised, so callers that
+    have already committed their notifications carry on.
+
+    Args:
+        coros: Coroutines to run
+
+    Returns:
+        list: Each coroutine's result or raised exception, in order
+    """
+    # Sends run in waves of one per pooled connection, each wave bounded by
+    # the per-send timeout; allow one extra wave of slack
+    waves = -(-len(coros) // settings.email_smtp_pool_size)
+    future = asyncio.run_coroutine_threadsafe(_gather_bounded(coros), _get_email_loop())
+    try:
+        return future.result(timeout=EMAIL_SEND_TIMEOUT * (waves + 1))
+    except concurrent.futures.TimeoutError as exc:
+        future.cancel()
+        return [exc] * len(coros)
+
+
+def _redis() -> redis.Redis:
+    """
+    Get the Redis client cached for the current worker thread.
+
+    Returns:
+        redis.Redis: The thread's Redis client
+    """
+    client = getattr(_thread_local, "redis", None)
+    if client is None:
+        client = _thread_local.redis = redis.Redis.from_url(settings.redis_url)
+    return client
+
+
+def _notification_type(value: str) -> NotificationType:
+    """
+    Validate a notification type value and return its enum member.
+
+    Args:
+        value: Notification type value
+
+    Returns:
+        NotificationType: The matching member
+
+    Raises:
+        ValueError: If the value is not a notification type
+    """
+    try:
+        return _NOTIFICATION_TYPES[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid NotificationType") from None
+
+
+def _as_uuid(value: Union[str, UUID]) -> UUID:
+    """
+    Normalize a UUID given as a string or UUID object.
+
+    Args:
+        value: UUID or its string form
+
+    Returns:
+        UUID: The parsed UUID
+
+    Raises:
+        ValueError: If a string is not a valid UUID
+    """
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def _existing_ids(db: Session, id_column, ids: set[UUID]) -> set[UUID]:
+    """
+    Return which of the given IDs exist, in a single query.
+
+    The IDs are bound as one uuid[] parameter to ``id = ANY(...)``, so every
+    batch size shares one statement and query plan, unlike an IN list with
+    a parameter per ID.
+
+    Args:
+        db: Database session
+        id_column: Primary key column to check, e.g. User.id
+        ids: IDs to check
+
+    Returns:
+        set[UUID]: The IDs that belong to existing rows
+    """
+    if not ids:
+        return set()
+    id_array = literal(list(ids), type_=ARRAY(PG_UUID(as_uuid=True)))
+    return set(db.execute(select(id_column).where(id_column == any_(id_array))).scalars())
+
+
+def _email_recipients(db: Session, user_ids: set[UUID]) -> dict[UUID, tuple[str, str]]:
+    """
+    Look up the email address and full name of each user, in a single query.
+
+    Rows are read as plain tuples before any email coroutine runs, so the
+    sends never touch the database from the email loop.
+
+    Args:
+        db: Database session
+        user_ids: IDs of the users to email
+
+    Returns:
+        dict[UUID, tuple[str, str]]: (email, full name) by user ID, for the
+        users that exist
+    """
+    if not user_ids:
+        return {}
+    id_array = literal(list(user_ids), type_=ARRAY(PG_UUID(as_uuid=True)))
+    rows = db.execute(
+        select(User.id, User.email, User.full_name).where(User.id == any_(id_array))
+    )
+    return {user_id: (email, full_name) for user_id, email, full_name in rows}
+
+
+def batchable_type(notification_type: str) -> bool:
+    """
+    Check whether a notification type is coalesced into batched digests.
+
+    Args:
+        notification_type: Notification type value
+
+    Returns:
+        bool: True if events of this type are batched
+    """
+    return notification_type in BATCHABLE_NOTIFICATION_TYPES
+
+
+def queue_batched_notification(
+    user_id: str,
+    notification_type: str,
+    message: str,
+    prompt_id: Optional[str] = None,
+    event_id: Optional[str] = None,
+) -> int:
+    """
+    Add a notification event to its user's pending batch in Redis.
+
+    The batch is written out by flush_notification_batches_task, on the beat
+    schedule or as soon as it reaches notification_batch_max_events.
+
+    Args:
+        user_id: UUID string of the user to notify
+        notification_type: Notification type value
+        message: Notification message
+        prompt_id: Optional prompt ID UUID string
+        event_id: Unique ID of the event, usually the Celery task ID; queueing
+            the same event again is a no-op. A random ID is used if omitted.
+
+    Returns:
+        int: Number of events now pending in the batch
+    """
+    key = NOTIFICATION_BATCH_KEY.format(
+        user_id=user_id, notification_type=notification_type
+    )
+    # The event ID keeps identical messages distinct within the sorted set,
+    # while a re-delivered task serializes to the same member
+    event = json.dumps(
+        {"id": event_id or uuid4().hex, "message": message, "prompt_id": prompt_id},
+        sort_keys=True,
+    )
+
+    pipe = _redis().pipeline()
+    pipe.zadd(key, {event: time.time()}, nx=True)
+    # Expire abandoned batches well after the flush window
+    pipe.expire(key, settings.notification_batch_window_seconds * 10)
+    pipe.sadd(NOTIFICATION_BATCH_INDEX_KEY, key)
+    pipe.zcard(key)
+    pending = pipe.execute()[-1]
+
+    if pending >= settings.notification_batch_max_events:
+        flush_notification_batches_task.delay()
+    return pending
 
 
 class DatabaseTask(Task):
     """Celery task with database session management."""
 
-    _db: Optional[Session] = None
-
     @property
     def db(self) -> Session:
-        """Get or create database session."""
-        if self._db is None:
-            self._db = SessionLocal()
-        return self._db
+        """Get the worker thread's database session."""
+        return _session()
 
     def after_return(self, *args, **kwargs):
-        """Close database session after task completion."""
-        if self._db is not None:
-            self._db.close()
-            self._db = None
+        """Release the session's connection after task completion."""
+        _session().close()
 
 
-@celery_app.task(base=DatabaseTask, bind=True, name="notifications.send_notification")
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="notifications.send_notification",
+    queue="notification_queue",
+    acks_late=True,
+    reject_on_worker_lost=True,
+    # Back off exponentially with jitter so workers don't retry in lock-step
+    autoretry_for=(OperationalError,),
+    retry_backoff=2,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=6,
+)
 def send_notification_task(
     self: DatabaseTask,
-    user_id: str,
+    user_id: Union[str, UUID],
     notification_type: str,
     message: str,
-    prompt_id: Optional[str] = None,
+    prompt_id: Optional[Union[str, UUID]] = None,
     send_email: bool = False,
 ) -> dict:
     """
@@ -47,60 +374,160 @@ def send_notification_task(
 
     Args:
         self: Task instance with database session
-        user_id: UUID string of the user to notify
+        user_id: ID of the user to notify, as a UUID or UUID string
         notification_type: Notification type (NEW_PROMPT, COMMENT, UPDATE)
         message: Notification message
-        prompt_id: Optional prompt ID UUID string
+        prompt_id: Optional prompt ID, as a UUID or UUID string
         send_email: Whether to also send email notification
 
     Returns:
         dict: Task result with notification ID and status
     """
-    from uuid import UUID
-
     try:
-        # Convert string UUIDs to UUID objects
-        user_uuid = UUID(user_id)
-        prompt_uuid = UUID(prompt_id) if prompt_id else None
-        notif_type = NotificationType(notification_type)
-
-        # Create notification in database
-        notification = NotificationService.create_notification(
-            db=self.db,
-            user_id=user_uuid,
-            notification_type=notif_type,
-            message=message,
-            prompt_id=prompt_uuid,
-        )
+        # Normalize IDs once; callers may pass UUIDs or their string form
+        user_uuid = _as_uuid(user_id)
+        prompt_uuid = _as_uuid(prompt_id) if prompt_id else None
+        notif_type = _notification_type(notification_type)
+
+        # Bursty emailed types are coalesced and delivered by the batch flush.
+        # The task ID names the event, so a re-delivered task is not re-added.
+        if send_email and batchable_type(notif_type):
+            queue_batched_notification(
+                user_id=str(user_uuid),
+                notification_type=notif_type.value,
+                message=message,
+                prompt_id=str(prompt_uuid) if prompt_uuid else None,
+                event_id=self.request.id,
+            )
+            return {
+                "notification_id": None,
+                "status": "batched",
+                "email_sent": False,
+            }
 
+        # Create notification in database; RETURNING hands back the new ID in
+        # the INSERT round trip, with no refresh SELECT afterwards. A retried
+        # task keeps its ID, so the key turns a repeated insert into a no-op.
+        notification_id = self.db.execute(
+            insert(Notification)
+            .values(
+                user_id=user_uuid,
+                type=notif_type,
+                message=message,
+                prompt_id=prompt_uuid,
+                is_read=False,
+                idempotency_key=self.request.id,
+            )
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "idempotency_key"],
+                index_where=Notification.idempotency_key.isnot(None),
+            )
+            .returning(Notification.id)
+        ).scalar_one_or_none()
+        self.db.commit()
+
+        status = "created"
+        if notification_id is None:
+            # An earlier attempt already stored the notification but may have
+            # died before queuing its email, so queue it again. The email task
+            # sends each notification at most once.
+            status = "duplicate"
+            notification_id = self.db.execute(
+                select(Notification.id).where(
+                    Notification.user_id == user_uuid,
+                    Notification.idempotency_key == self.request.id,
+                )
+            ).scalar_one()
+
+        notification_id_str = str(notification_id)
         result = {
-            "notification_id": str(notification.id),
-            "status": "created",
+            "notification_id": notification_id_str,
+            "status": status,
             "email_sent": False,
         }
 
-        # Send email if enabled
-        if send_email and EmailService.is_enabled():
-            try:
-                # Run async email function in event loop
-                asyncio.run(
-                    EmailService.send_notification_email(
-                        user_id=user_uuid,
-                        notification_type=notif_type,
-                        message=message,
-                        prompt_id=prompt_uuid,
-                    )
-                )
-                result["email_sent"] = True
-            except Exception as e:
-                # Log error but don't fail the task
-                result["email_sent"] = False
-                result["email_error"] = str(e)
+        # Hand the email to its own task so this one acks without waiting on SMTP
+        if send_email and _EMAIL_ENABLED:
+            send_notification_email_task.apply_async(
+                args=[notification_id_str], queue="email_queue"
+            )
+            result["email_sent"] = "queued"
 
         return result
-    except Exception as e:
-        # Task will be retried on failure
-        raise self.retry(exc=e, countdown=60, max_retries=3)
+    except Exception:
+        # Discard any failed flush so the thread's session stays usable;
+        # database outages are retried by autoretry_for
+        self.db.rollback()
+        raise
+
+
+@celery_app.task(
+    base=DatabaseTask,
+    bind=True,
+    name="notifications.send_notification_email",
+    queue="email_queue",
+    rate_limit="30/s",
+    # SMTP failures and slow relays are usually transient; back off with
+    # jitter between tries
+    autoretry_for=(aiosmtplib.SMTPException, concurrent.futures.TimeoutError),
+    retry_backoff=2,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=5,
+)
+def send_notification_email_task(self: DatabaseTask, notification_id: str) -> dict:
+    """
+    Celery task to send the email for an already stored notification.
+
+    Args:
+        self: Task instance with database session
+        notification_id: UUID string of the notification to email
+
+    Returns:
+        dict: Task result with email status
+    """
+    notification = self.db.get(Notification, UUID(notification_id))
+    if notification is None:
+        return {
+            "notification_id": notification_id,
+            "email_sent": False,
+            "email_error": "Notification not found",
+        }
+
+    user = self.db.get(User, notification.user_id)
+    if user is None:
+        return {
+            "notification_id": notification_id,
+            "email_sent": False,
+            "email_error": "User not found",
+        }
+
+    # Claim the notification so a re-queued email is not sent twice; a failed
+    # send releases the claim for its retry
+    client = _redis()
+    claim_key = NOTIFICATION_EMAIL_CLAIM_KEY.format(notification_id=notification_id)
+    if not client.set(claim_key, self.request.id or "", nx=True, ex=NOTIFICATION_EMAIL_CLAIM_TTL):
+        return {
+            "notification_id": notification_id,
+            "email_sent": False,
+            "email_error": "Email already sent",
+        }
+
+    try:
+        _run_email(
+            EmailService.send_notification_email(
+                to_email=user.email,
+                to_name=user.full_name,
+                notification_type=notification.type,
+                message=notification.message,
+                prompt_id=notification.prompt_id,
+            )
+        )
+    except BaseException:
+        client.delete(claim_key)
+        raise
+
+    return {"notification_id": notification_id, "email_sent": True}
 
 
 @celery_app.task(name="notifications.send_bulk_notifications")
@@ -133,48 +560,392 @@ def send_bulk_notifications_task(
         "errors": [],
     }
 
-    db = SessionLocal()
+    db = _session()
     try:
-        notif_type = NotificationType(notification_type)
+        notif_type = _notification_type(notification_type)
         prompt_uuid = UUID(prompt_id) if prompt_id else None
 
+        # Parse IDs up front so malformed ones fail without a database round trip
+        parsed_ids = []
         for user_id_str in user_ids:
             try:
-                user_uuid = UUID(user_id_str)
+                parsed_ids.append((user_id_str, UUID(user_id_str)))
+            except ValueError as e:
+                results["failed"] += 1
+                results["errors"].append(f"Error for {user_id_str}: {str(e)}")
+
+        # Validate every recipient with a single SELECT ... WHERE id = ANY(...)
+        existing_ids = _existing_ids(db, User.id, {user_uuid for _, user_uuid in parsed_ids})
 
-                # Create notification
-                NotificationService.create_notification(
-                    db=db,
-                    user_id=user_uuid,
+        recipients = []
+        for user_id_str, user_uuid in parsed_ids:
+            if user_uuid in existing_ids:
+                recipients.append((user_id_str, user_uuid))
+            else:
+                results["failed"] += 1
+                results["errors"].append(f"Error for {user_id_str}: User not found")
+
+        # Create all notifications with one Core executemany INSERT of plain
+        # dicts, bypassing the ORM's per-row bulk insert bookkeeping
+        if recipients:
+            now = datetime.now(timezone.utc)
+            db.execute(
+                Notification.__table__.insert(),
+                [
+                    {
+                        "id": uuid4(),
+                        "user_id": user_uuid,
+                        "type": notif_type,
+                        "message": message,
+                        "prompt_id": prompt_uuid,
+                        "is_read": False,
+                        "created_at": now,
+                    }
+                    for _, user_uuid in recipients
+                ],
+            )
+            db.commit()
+        results["created"] = len(recipients)
+
+        # Send emails concurrently on the shared event loop
+        if send_email and _EMAIL_ENABLED and recipients:
+            contacts = _email_recipients(db, {user_uuid for _, user_uuid in recipients})
+            recipients = [r for r in recipients if r[1] in contacts]
+            outcomes = _run_emails([
+                EmailService.send_notification_email(
+                    to_email=contacts[user_uuid][0],
+                    to_name=contacts[user_uuid][1],
                     notification_type=notif_type,
                     message=message,
                     prompt_id=prompt_uuid,
                 )
-                results["created"] += 1
-
-                # Send email if enabled
-                if send_email and EmailService.is_enabled():
-                    try:
-                        # Run async email function in event loop
-                        asyncio.run(
-                            EmailService.send_notification_email(
-                                user_id=user_uuid,
-                                notification_type=notif_type,
-                                message=message,
-                                prompt_id=prompt_uuid,
-                            )
-                        )
-                        results["email_sent"] += 1
-                    except Exception as e:
-                        results["errors"].append(f"Email error for {user_id_str}: {str(e)}")
+                for _, user_uuid in recipients
+            ])
+            for (user_id_str, _), outcome in zip(recipients, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    results["errors"].append(f"Email error for {user_id_str}: {str(outcome)}")
+                else:
+                    results["email_sent"] += 1
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
 
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append(f"Error for {user_id_str}: {str(e)}")
+    return results
+
+
+@celery_app.task(name="notifications.flush_notification_batches")
+def flush_notification_batches_task() -> dict:
+    """
+    Celery beat task to write out pending notification batches.
+
+    Every (user, type) batch becomes one Notification row and one digest
+    email. All rows are saved in a single bulk write.
+
+    Returns:
+        dict: Task result with batch, event and email counts
+    """
+    results = {
+        "batches": 0,
+        "events": 0,
+        "email_sent": 0,
+        "errors": [],
+    }
+
+    client = _redis()
+    ack_batch = client.register_script(_ACK_BATCH_SCRIPT)
+
+    def ack(key: str, members: list) -> None:
+        ack_batch(keys=[key, NOTIFICATION_BATCH_INDEX_KEY], args=members)
+
+    # Overlapping flushes (beat plus an early size-triggered one) would write
+    # the same events twice; whoever holds the lock does the work
+    lock = client.lock(NOTIFICATION_BATCH_LOCK_KEY, timeout=600)
+    if not lock.acquire(blocking=False):
+        return results
+
+    try:
+        return _flush_notification_batches(client, ack, results)
+    finally:
+        try:
+            lock.release()
+        except redis.exceptions.LockError:
+            # The lock expired during a very long flush; nothing to release
+            pass
+
+
+def _flush_notification_batches(
+    client: redis.Redis,
+    ack: Callable[[str, list], None],
+    results: dict,
+) -> dict:
+    """
+    Write out pending batches while holding the flush lock.
+
+    Events are read without being removed. Unparseable events, and events for
+    deleted users, are discarded with an error; everything else is removed
+    only after its digest row has committed, so a failed write leaves the
+    events for the next flush.
+
+    Args:
+        client: Redis client
+        ack: Callable removing handled events from a batch key
+        results: Result dict to fill in
+
+    Returns:
+        dict: The filled-in result dict
+    """
+    cutoff = time.time()
+
+    # (key, user ID, type, parsed events, raw members)
+    batches = []
+    for key in client.smembers(NOTIFICATION_BATCH_INDEX_KEY):
+        key = key.decode() if isinstance(key, bytes) else key
+        members = client.zrangebyscore(key, "-inf", cutoff)
+        if not members:
+            ack(key, [])
+            continue
 
-        db.commit()
+        try:
+            _, _, user_id_str, type_value = key.split(":", 3)
+            user_uuid = UUID(user_id_str)
+            notif_type = _notification_type(type_value)
+        except ValueError as e:
+            results["errors"].append(f"Discarded batch {key}: {str(e)}")
+            ack(key, members)
+            continue
+
+        events, valid_members, bad_members = [], [], []
+        for member in members:
+            try:
+                event = json.loads(member)
+                prompt_uuid = _as_uuid(event["prompt_id"]) if event["prompt_id"] else None
+                events.append({"message": str(event["message"]), "prompt_id": prompt_uuid})
+                valid_members.append(member)
+            except (ValueError, KeyError, TypeError) as e:
+                results["errors"].append(f"Discarded event in {key}: {str(e)}")
+                bad_members.append(member)
+        if bad_members:
+            ack(key, bad_members)
+        if events:
+            batches.append((key, user_uuid, notif_type, events, valid_members))
+
+    if not batches:
+        return results
+
+    db = _session()
+    try:
+        # Skip batches for users deleted since their events were queued, and
+        # drop links to prompts deleted since then rather than violate the FK
+        existing_users = _existing_ids(db, User.id, {batch[1] for batch in batches})
+        existing_prompts = _existing_ids(
+            db,
+            Prompt.id,
+            {
+                event["prompt_id"]
+                for batch in batches
+                for event in batch[3]
+                if event["prompt_id"]
+            },
+        )
+
+        now = datetime.now(timezone.utc)
+        digests = []
+        written = []
+        for key, user_uuid, notif_type, events, members in batches:
+            if user_uuid not in existing_users:
+                results["errors"].append(f"Error for {user_uuid}: User not found")
+                ack(key, members)
+                continue
+
+            latest = events[-1]
+            if len(events) == 1:
+                message = latest["message"]
+            else:
+                message = f"You have {len(events)} new notifications. Latest: {latest['message']}"
+            prompt_uuid = latest["prompt_id"] if latest["prompt_id"] in existing_prompts else None
+
+            digests.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user_uuid,
+                    "type": notif_type,
+                    "message": message,
+                    "prompt_id": prompt_uuid,
+                    "is_read": False,
+                    "created_at": now,
+                }
+            )
+            written.append((key, members))
+            results["events"] += len(events)
+
+        if digests:
+            db.execute(Notification.__table__.insert(), digests)
+            db.commit()
+        results["batches"] = len(digests)
+
+        # The digests are durable; only now remove their events from Redis
+        for key, members in written:
+            ack(key, members)
+
+        # Batches are only queued for emailed notifications; one digest each
+        if _EMAIL_ENABLED and digests:
+            contacts = _email_recipients(db, {digest["user_id"] for digest in digests})
+            digests = [digest for digest in digests if digest["user_id"] in contacts]
+            outcomes = _run_emails([
+                EmailService.send_notification_email(
+                    to_email=contacts[digest["user_id"]][0],
+                    to_name=contacts[digest["user_id"]][1],
+                    notification_type=digest["type"],
+                    message=digest["message"],
+                    prompt_id=digest["prompt_id"],
+                )
+                for digest in digests
+            ])
+            for digest, outcome in zip(digests, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    results["errors"].append(f"Email error for {digest['user_id']}: {str(outcome)}")
+                else:
+                    results["email_sent"] += 1
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
     return results
 
+
+# Recipients fetched, inserted and committed per step of a filter fan-out
+FILTER_FANOUT_CHUNK_SIZE = 1000
+
+
+def _recipient_query(filter_spec: dict) -> Select:
+    """
+    Build the query selecting the user IDs a filter spec describes.
+
+    Supported keys:
+        category_ids: Notify users following any of these categories
+        exclude_user_ids: Never notify these users
+
+    Args:
+        filter_spec: Recipient filter with UUID strings as values
+
+    Returns:
+        Select: Distinct matching user IDs, ordered by ID
+
+    Raises:
+        ValueError: If the spec has unknown keys or no category_ids
+    """
+    unknown = set(filter_spec) - {"category_ids", "exclude_user_ids"}
+    if unknown:
+        raise ValueError(f"Unsupported filter keys: {', '.join(sorted(unknown))}")
+    if not filter_spec.get("category_ids"):
+        raise ValueError("filter_spec requires category_ids")
+
+    stmt = (
+        select(UserFollow.user_id)
+        .where(UserFollow.category_id.in_([UUID(c) for c in filter_spec["category_ids"]]))
+        .distinct()
+        .order_by(UserFollow.user_id)
+    )
+    if filter_spec.get("exclude_user_ids"):
+        stmt = stmt.where(
+            UserFollow.user_id.not_in([UUID(u) for u in filter_spec["exclude_user_ids"]])
+        )
+    return stmt
+
+
+@celery_app.task(name="notifications.send_notifications_by_filter")
+def send_notifications_by_filter_task(
+    filter_spec: dict,
+    notification_type: str,
+    message: str,
+    prompt_id: Optional[str] = None,
+    send_email: bool = False,
+) -> dict:
+    """
+    Celery task to notify every user matching a filter spec.
+
+    Recipients are resolved inside the task, so the message carries a small
+    spec rather than every user ID. They are read, inserted and committed in
+    keyset-paginated chunks, keeping memory flat however large the fan-out.
+
+    Args:
+        filter_spec: Recipient filter (see _recipient_query)
+        notification_type: Notification type
+        message: Notification message
+        prompt_id: Optional prompt ID UUID string
+        send_email: Whether to also send email notifications
+
+    Returns:
+        dict: Task result with counts and status
+    """
+    results = {
+        "created": 0,
+        "email_sent": 0,
+        "errors": [],
+    }
+
+    db = _session()
+    try:
+        notif_type = _notification_type(notification_type)
+        prompt_uuid = UUID(prompt_id) if prompt_id else None
+        stmt = _recipient_query(filter_spec).limit(FILTER_FANOUT_CHUNK_SIZE)
+
+        last_id = None
+        while True:
+            page = stmt if last_id is None else stmt.where(UserFollow.user_id > last_id)
+            user_ids = db.execute(page).scalars().all()
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            now = datetime.now(timezone.utc)
+            db.execute(
+                Notification.__table__.insert(),
+                [
+                    {
+                        "id": uuid4(),
+                        "user_id": user_uuid,
+                        "type": notif_type,
+                        "message": message,
+                        "prompt_id": prompt_uuid,
+                        "is_read": False,
+                        "created_at": now,
+                    }
+                    for user_uuid in user_ids
+                ],
+            )
+            db.commit()
+            results["created"] += len(user_ids)
+
+            if send_email and _EMAIL_ENABLED:
+                contacts = _email_recipients(db, set(user_ids))
+                emailed = [user_uuid for user_uuid in user_ids if user_uuid in contacts]
+                outcomes = _run_emails([
+                    EmailService.send_notification_email(
+                        to_email=contacts[user_uuid][0],
+                        to_name=contacts[user_uuid][1],
+                        notification_type=notif_type,
+                        message=message,
+                        prompt_id=prompt_uuid,
+                    )
+                    for user_uuid in emailed
+                ])
+                for user_uuid, outcome in zip(emailed, outcomes, strict=True):
+                    if isinstance(outcome, Exception):
+                        results["errors"].append(f"Email error for {user_uuid}: {str(outcome)}")
+                    else:
+                        results["email_sent"] += 1
+
+            if len(user_ids) < FILTER_FANOUT_CHUNK_SIZE:
+                break
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return results
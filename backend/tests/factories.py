@@ -0,0 +1,113 @@
+"""Builders and seeding helpers for test data.
+
+Every test that needs rows goes through this module so that defaults and
+the persistence policy live in one place. ``build_*`` return transient
+instances; ``seed`` and the ``create_*`` shortcuts persist them.
+
+Rows are always committed, never just flushed. Sessions created by the test
+fixtures join the connection's outer transaction with savepoints, so a
+commit only releases a SAVEPOINT and is still discarded at teardown, while a
+merely flushed row would be lost if the code under test calls rollback().
+"""
+
+import itertools
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.constants import PlatformTag, PromptStatus, UserRole
+from src.models.prompt import Prompt
+from src.models.user import User
+
+_counter = itertools.count(1)
+
+
+def build_user(**overrides) -> User:
+    """
+    Build an unsaved member with a unique username and email.
+
+    Args:
+        **overrides: Any column values to set instead of the defaults
+
+    Returns:
+        User: The new, transient user
+    """
+    n = next(_counter)
+    fields = {
+        "username": f"user_{n}",
+        "email": f"user_{n}@company.com",
+        "full_name": f"User {n}",
+        "role": UserRole.MEMBER,
+        **overrides,
+    }
+    return User(**fields)
+
+
+def build_prompt(author_id: UUID, **overrides) -> Prompt:
+    """
+    Build an unsaved published GitHub Copilot prompt.
+
+    Args:
+        author_id: Author of the prompt
+        **overrides: Any column values to set instead of the defaults
+
+    Returns:
+        Prompt: The new, transient prompt
+    """
+    fields = {
+        "title": "Test Prompt",
+        "content": "Prompt content",
+        "platform_tags": [PlatformTag.GITHUB_COPILOT],
+        "status": PromptStatus.PUBLISHED,
+        **overrides,
+    }
+    return Prompt(author_id=author_id, **fields)
+
+
+def seed(db: Session, *objs):
+    """
+    Add objects to the session and commit them.
+
+    Args:
+        db: Database session
+        *objs: Model instances to persist
+
+    Returns:
+        tuple: The objects, in the order given
+    """
+    db.add_all(objs)
+    db.commit()
+    return objs
+
+
+def create_user(db: Session, **overrides) -> User:
+    """
+    Build and commit a user.
+
+    Args:
+        db: Database session
+        **overrides: Any column values to set instead of the defaults
+
+    Returns:
+        User: The persisted user
+    """
+    (user,) = seed(db, build_user(**overrides))
+    return user
+
+
+def create_prompt(db: Session, author: User | None = None, **overrides) -> Prompt:
+    """
+    Build and commit a prompt, creating an author when none is given.
+
+    Args:
+        db: Database session
+        author: Author of the prompt
+        **overrides: Any column values to set instead of the defaults
+
+    Returns:
+        Prompt: The persisted prompt
+    """
+    if author is None:
+        author = create_user(db)
+    (prompt,) = seed(db, build_prompt(author.id, **overrides))
+    return prompt
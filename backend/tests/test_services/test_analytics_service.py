@@ -5,11 +5,10 @@ from uuid import uuid4
 
 import pytest
 
-from src.constants import AnalyticsEventType, PlatformTag, PromptStatus, UserRole
-from src.models.prompt import Prompt
+from src.constants import AnalyticsEventType, PlatformTag
 from src.models.prompt_copy_event import PromptCopyEvent
-from src.models.user import User
 from src.services.analytics_service import AnalyticsService
+from tests.factories import create_prompt, create_user
 
 
 class TestAnalyticsService:
@@ -17,21 +16,8 @@ class TestAnalyticsService:
 
     def test_track_event_view(self, db_session):
         """Test tracking a view event."""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            full_name="Test User",
-            role=UserRole.MEMBER,
-        )
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Test content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=user.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add_all([user, prompt])
-        db_session.commit()
+        user = create_user(db_session)
+        prompt = create_prompt(db_session, author=user)
 
         event = AnalyticsService.track_event(
             db=db_session,
@@ -49,14 +35,7 @@ class TestAnalyticsService:
 
     def test_track_event_search(self, db_session):
         """Test tracking a search event with metadata."""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            full_name="Test User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(user)
-        db_session.commit()
+        user = create_user(db_session)
 
         metadata = {
             "query": "test query",
@@ -79,21 +58,8 @@ class TestAnalyticsService:
 
     def test_track_event_copy(self, db_session):
         """Test tracking a copy event."""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            full_name="Test User",
-            role=UserRole.MEMBER,
-        )
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Test content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=user.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add_all([user, prompt])
-        db_session.commit()
+        user = create_user(db_session)
+        prompt = create_prompt(db_session, author=user)
 
         event = AnalyticsService.track_event(
             db=db_session,
@@ -110,21 +76,8 @@ class TestAnalyticsService:
 
     def test_get_prompt_analytics(self, db_session):
         """Test getting analytics for a specific prompt."""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            full_name="Test User",
-            role=UserRole.MEMBER,
-        )
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Test content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=user.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add_all([user, prompt])
-        db_session.commit()
+        user = create_user(db_session)
+        prompt = create_prompt(db_session, author=user)
 
         # Create some view events
         for _ in range(5):
@@ -168,28 +121,15 @@ class TestAnalyticsService:
 
     def test_get_overview_analytics(self, db_session):
         """Test getting overview analytics."""
-        user = User(
-            username="testuser",
-            email="test@example.com",
-            full_name="Test User",
-            role=UserRole.MEMBER,
-        )
-        prompt1 = Prompt(
-            title="Prompt 1",
-            content="Content 1",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=user.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt2 = Prompt(
+        user = create_user(db_session)
+        prompt1 = create_prompt(db_session, author=user, title="Prompt 1", content="Content 1")
+        prompt2 = create_prompt(
+            db_session,
+            author=user,
             title="Prompt 2",
             content="Content 2",
             platform_tags=[PlatformTag.CURSOR],
-            author_id=user.id,
-            status=PromptStatus.PUBLISHED,
         )
-        db_session.add_all([user, prompt1, prompt2])
-        db_session.commit()
 
         # Create various events
         for _ in range(10):
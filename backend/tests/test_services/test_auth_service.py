@@ -5,8 +5,8 @@ import pytest
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
-from src.models.user import User
 from src.services.auth_service import AuthService
+from tests.factories import create_user
 from src.constants import UserRole
 
 
@@ -98,14 +98,12 @@ class TestAuthService:
     def test_get_or_create_user_existing_user(self, db_session):
         """Test getting existing user from LDAP info."""
         # Create existing user
-        existing_user = User(
+        existing_user = create_user(
+            db_session,
             username="existinguser",
             email="existinguser@company.com",
             full_name="Existing User",
-            role=UserRole.MEMBER,
         )
-        db_session.add(existing_user)
-        db_session.commit()
 
         ldap_user_info = {
             "username": "existinguser",
@@ -5,9 +5,9 @@ from fastapi import HTTPException, status
 
 from src.constants import UserRole
 from src.models.category import Category
-from src.models.user import User
 from src.schemas.category import CategoryCreate, CategoryUpdate
 from src.services.category_service import CategoryService
+from tests.factories import create_prompt, create_user
 
 
 class TestCategoryService:
@@ -15,14 +15,7 @@ class TestCategoryService:
 
     def test_create_category_as_admin(self, db_session):
         """Test creating category as admin."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
-        db_session.commit()
+        admin = create_user(db_session, username="admin", role=UserRole.ADMIN)
 
         category_data = CategoryCreate(
             name="Test Category",
@@ -39,14 +32,7 @@ class TestCategoryService:
 
     def test_create_category_as_moderator(self, db_session):
         """Test creating category as moderator."""
-        moderator = User(
-            username="moderator",
-            email="moderator@company.com",
-            full_name="Moderator User",
-            role=UserRole.MODERATOR,
-        )
-        db_session.add(moderator)
-        db_session.commit()
+        moderator = create_user(db_session, username="moderator", role=UserRole.MODERATOR)
 
         category_data = CategoryCreate(
             name="Mod Category",
@@ -60,14 +46,7 @@ class TestCategoryService:
 
     def test_create_category_as_member_forbidden(self, db_session):
         """Test that members cannot create categories."""
-        member = User(
-            username="member",
-            email="member@company.com",
-            full_name="Member User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(member)
-        db_session.commit()
+        member = create_user(db_session, username="member")
 
         category_data = CategoryCreate(
             name="Member Category",
@@ -82,14 +61,7 @@ class TestCategoryService:
 
     def test_create_category_duplicate_name(self, db_session):
         """Test creating category with duplicate name."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
-        db_session.commit()
+        admin = create_user(db_session, username="admin", role=UserRole.ADMIN)
 
         # Create first category
         existing = Category(name="Existing", slug="existing", description="Exists")
@@ -109,14 +81,7 @@ class TestCategoryService:
 
     def test_create_category_duplicate_slug(self, db_session):
         """Test creating category with duplicate slug."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
-        db_session.commit()
+        admin = create_user(db_session, username="admin", role=UserRole.ADMIN)
 
         # Create first category
         existing = Category(name="Different Name", slug="existing", description="Exists")
@@ -200,13 +165,7 @@ class TestCategoryService:
 
     def test_update_category_as_admin(self, db_session):
         """Test updating category as admin."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
+        admin = create_user(db_session, role=UserRole.ADMIN)
         category = Category(name="Original", slug="original", description="Original")
         db_session.add(category)
         db_session.commit()
@@ -221,13 +180,7 @@ class TestCategoryService:
 
     def test_update_category_as_member_forbidden(self, db_session):
         """Test that members cannot update categories."""
-        member = User(
-            username="member",
-            email="member@company.com",
-            full_name="Member User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(member)
+        member = create_user(db_session)
         category = Category(name="Test", slug="test", description="Test")
         db_session.add(category)
         db_session.commit()
@@ -241,13 +194,7 @@ class TestCategoryService:
 
     def test_update_category_slug_conflict(self, db_session):
         """Test updating category with conflicting slug."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
+        admin = create_user(db_session, role=UserRole.ADMIN)
         cat1 = Category(name="Category 1", slug="cat-1", description="First")
         cat2 = Category(name="Category 2", slug="cat-2", description="Second")
         db_session.add_all([cat1, cat2])
@@ -262,13 +209,7 @@ class TestCategoryService:
 
     def test_delete_category_as_admin(self, db_session):
         """Test deleting category as admin."""
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
+        admin = create_user(db_session, role=UserRole.ADMIN)
         category = Category(name="To Delete", slug="to-delete", description="Delete")
         db_session.add(category)
         db_session.commit()
@@ -282,13 +223,7 @@ class TestCategoryService:
 
     def test_delete_category_as_moderator_forbidden(self, db_session):
         """Test that moderators cannot delete categories."""
-        moderator = User(
-            username="moderator",
-            email="moderator@company.com",
-            full_name="Moderator User",
-            role=UserRole.MODERATOR,
-        )
-        db_session.add(moderator)
+        moderator = create_user(db_session, role=UserRole.MODERATOR)
         category = Category(name="Test", slug="test", description="Test")
         db_session.add(category)
         db_session.commit()
@@ -300,31 +235,13 @@ class TestCategoryService:
 
     def test_delete_category_in_use(self, db_session):
         """Test that categories in use cannot be deleted."""
-        from src.models.prompt import Prompt
-        from src.constants import PromptStatus, PlatformTag
-
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(admin)
+        admin = create_user(db_session, role=UserRole.ADMIN)
         category = Category(name="In Use", slug="in-use", description="Used")
         db_session.add(category)
         db_session.commit()
 
         # Create prompt with this category
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=admin.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt.categories = [category]
-        db_session.add(prompt)
-        db_session.commit()
+        create_prompt(db_session, author=admin, categories=[category])
 
         with pytest.raises(HTTPException) as exc_info:
             CategoryService.delete_category(db_session, category.id, admin)
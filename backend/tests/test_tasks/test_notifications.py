@@ -1,15 +1,27 @@
 """Tests for notification Celery tasks."""
 
+import asyncio
+import concurrent.futures
 import os
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
 import pytest
-from uuid import uuid4
+from sqlalchemy import event
 
 from src.constants import NotificationType
+from src.models.category import Category
 from src.models.notification import Notification
 from src.models.user import User
-from src.tasks.notifications import send_bulk_notifications_task, send_notification_task
+from src.models.user_follow import UserFollow
+from src.tasks.notifications import (
+    _run_email,
+    flush_notification_batches_task,
+    send_bulk_notifications_task,
+    send_notification_email_task,
+    send_notification_task,
+    send_notifications_by_filter_task,
+)
 
 # Disable Celery result backend for tests to avoid Redis connection
 os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
@@ -30,8 +42,8 @@ class TestNotificationTasks:
         db_session.commit()
 
         # Call task function directly using .run() which handles bound task self automatically
-        # Patch SessionLocal to use our test session
-        with patch("src.tasks.notifications.SessionLocal", return_value=db_session):
+        # Patch the thread-cached session to use our test session
+        with patch("src.tasks.notifications._session", return_value=db_session):
             result = send_notification_task.run(
                 user_id=str(user.id),
                 notification_type=NotificationType.NEW_PROMPT.value,
@@ -51,6 +63,60 @@ class TestNotificationTasks:
         assert notification is not None
         assert notification.message == "Test notification"
 
+    def test_send_notification_task_accepts_uuid_objects(self, db_session):
+        """Test that internal callers can pass UUIDs instead of strings."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_id = user.id
+
+        with patch("src.tasks.notifications._session", return_value=db_session):
+            result = send_notification_task.run(
+                user_id=user_id,
+                notification_type=NotificationType.UPDATE.value,
+                message="Test notification",
+            )
+
+        assert result["status"] == "created"
+        notification = db_session.get(Notification, UUID(result["notification_id"]))
+        assert notification.user_id == user_id
+
+    def test_send_notification_task_retry_is_idempotent(self, db_session):
+        """Test that re-running a task with the same ID does not duplicate the row."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_id = user.id
+
+        send_notification_task.push_request(id="retried-task-id")
+        try:
+            with patch("src.tasks.notifications._session", return_value=db_session):
+                results = [
+                    send_notification_task.run(
+                        user_id=str(user_id),
+                        notification_type=NotificationType.UPDATE.value,
+                        message="Test notification",
+                    )
+                    for _ in range(2)
+                ]
+        finally:
+            send_notification_task.pop_request()
+
+        assert [result["status"] for result in results] == ["created", "duplicate"]
+        assert results[1]["notification_id"] == results[0]["notification_id"]
+        count = db_session.query(Notification).filter(
+            Notification.user_id == user_id
+        ).count()
+        assert count == 1
+
     def test_send_notification_task_with_email(self, db_session):
         """Test sending notification with email enabled."""
         # Create user
@@ -62,33 +128,175 @@ class TestNotificationTasks:
         db_session.add(user)
         db_session.commit()
 
-        # Create a mock task instance with db property
-        class MockTask:
-            def __init__(self):
-                self._db = db_session
-            @property
-            def db(self):
-                return self._db
-            def retry(self, *args, **kwargs):
-                raise Exception("Retry called")
-
-        # Mock email service
-        with patch("src.tasks.notifications.SessionLocal", return_value=db_session):
-            with patch("src.tasks.notifications.EmailService.is_enabled", return_value=True):
-                with patch("src.tasks.notifications.EmailService.send_notification_email", new_callable=AsyncMock) as mock_email:
-                    # Call task function directly using .run()
+        with patch("src.tasks.notifications._session", return_value=db_session):
+            with patch("src.tasks.notifications._EMAIL_ENABLED", True):
+                with patch(
+                    "src.tasks.notifications.send_notification_email_task.apply_async"
+                ) as mock_apply_async:
+                    # UPDATE is not batched, so the email is queued immediately
                     result = send_notification_task.run(
                         user_id=str(user.id),
-                        notification_type=NotificationType.COMMENT.value,
+                        notification_type=NotificationType.UPDATE.value,
+                        message="Test notification",
+                        send_email=True,
+                    )
+
+        assert result["status"] == "created"
+        assert result["email_sent"] == "queued"
+        mock_apply_async.assert_called_once_with(
+            args=[result["notification_id"]], queue="email_queue"
+        )
+
+    def test_send_notification_task_retry_requeues_email(self, db_session):
+        """Test that a retried task queues the email for the existing notification."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_id = user.id
+
+        send_notification_task.push_request(id="retried-task-id")
+        try:
+            with patch("src.tasks.notifications._session", return_value=db_session), \
+                 patch("src.tasks.notifications._EMAIL_ENABLED", True), \
+                 patch(
+                     "src.tasks.notifications.send_notification_email_task.apply_async"
+                 ) as mock_apply_async:
+                results = [
+                    send_notification_task.run(
+                        user_id=str(user_id),
+                        notification_type=NotificationType.UPDATE.value,
                         message="Test notification",
-                        prompt_id=str(uuid4()),
                         send_email=True,
                     )
+                    for _ in range(2)
+                ]
+        finally:
+            send_notification_task.pop_request()
+
+        assert results[1]["status"] == "duplicate"
+        assert results[1]["email_sent"] == "queued"
+        assert mock_apply_async.call_count == 2
+        for call in mock_apply_async.call_args_list:
+            assert call.kwargs["args"] == [results[0]["notification_id"]]
+
+    def test_send_notification_email_task(self, db_session, redis_client):
+        """Test that the email task sends the stored notification once."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        notification = Notification(
+            user_id=user.id,
+            type=NotificationType.UPDATE,
+            message="Stored notification",
+        )
+        db_session.add(notification)
+        db_session.flush()
+
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch(
+                 "src.tasks.notifications.EmailService.send_notification_email",
+                 new_callable=AsyncMock,
+             ) as mock_email:
+            result = send_notification_email_task.run(str(notification.id))
+            repeat = send_notification_email_task.run(str(notification.id))
+
+        assert result["email_sent"] is True
+        assert repeat["email_sent"] is False
+        mock_email.assert_awaited_once_with(
+            to_email="test@example.com",
+            to_name="Test User",
+            notification_type=NotificationType.UPDATE,
+            message="Stored notification",
+            prompt_id=None,
+        )
+
+    def test_send_notification_email_task_failure_releases_claim(self, db_session, redis_client):
+        """Test that a failed send can be retried."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        notification = Notification(
+            user_id=user.id,
+            type=NotificationType.UPDATE,
+            message="Stored notification",
+        )
+        db_session.add(notification)
+        db_session.flush()
+
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch(
+                 "src.tasks.notifications.EmailService.send_notification_email",
+                 new_callable=AsyncMock,
+                 side_effect=[ConnectionError("SMTP unavailable"), None],
+             ) as mock_email:
+            with pytest.raises(ConnectionError):
+                send_notification_email_task.run(str(notification.id))
+            result = send_notification_email_task.run(str(notification.id))
 
-                assert result["status"] == "created"
-                assert result["email_sent"] is True
-                # Note: AsyncMock needs to be awaited, but in Celery task context
-                # we'd need to handle this differently in real implementation
+        assert result["email_sent"] is True
+        assert mock_email.await_count == 2
+
+    def test_send_notification_email_task_retries_timeouts(self, db_session, redis_client):
+        """Test that a send that times out is retried, not dropped."""
+        user = User(
+            email="test@example.com",
+            username="testuser",
+            full_name="Test User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        notification = Notification(
+            user_id=user.id,
+            type=NotificationType.UPDATE,
+            message="Stored notification",
+        )
+        db_session.add(notification)
+        db_session.flush()
+
+        timeout = concurrent.futures.TimeoutError()
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch("src.tasks.notifications._run_email", side_effect=timeout), \
+             patch.object(
+                 send_notification_email_task, "retry", side_effect=RuntimeError("retrying")
+             ) as mock_retry:
+            with pytest.raises(RuntimeError, match="retrying"):
+                send_notification_email_task.run(str(notification.id))
+
+        assert mock_retry.call_args.kwargs["exc"] is timeout
+        # The claim is released so the retry can send
+        assert redis_client.keys("notif:email:*") == []
+
+    def test_run_email_cancels_send_on_timeout(self):
+        """Test that a timed-out send is cancelled on the email loop."""
+        cancelled = concurrent.futures.Future()
+
+        async def slow_send():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set_result(True)
+                raise
+
+        with patch("src.tasks.notifications.EMAIL_SEND_TIMEOUT", 0.05):
+            with pytest.raises(concurrent.futures.TimeoutError):
+                _run_email(slow_send())
+
+        assert cancelled.result(timeout=1) is True
 
     def test_send_bulk_notifications_task(self, db_session):
         """Test sending notifications to multiple users."""
@@ -106,8 +314,8 @@ class TestNotificationTasks:
 
         user_ids = [str(user.id) for user in users]
 
-        # Patch SessionLocal to use test db_session
-        with patch("src.tasks.notifications.SessionLocal", return_value=db_session):
+        # Patch the thread-cached session to use test db_session
+        with patch("src.tasks.notifications._session", return_value=db_session):
             # Call task function directly using .run() method
             result = send_bulk_notifications_task.run(
                 user_ids=user_ids,
@@ -122,12 +330,156 @@ class TestNotificationTasks:
         assert result["failed"] == 0
         assert result["email_sent"] == 0
 
-        # Verify all notifications were created
+        # Verify all notifications were created (the task closed the session,
+        # so filter on the IDs captured beforehand)
         notifications = db_session.query(Notification).filter(
-            Notification.user_id.in_([user.id for user in users])
+            Notification.user_id.in_(user_ids)
         ).all()
         assert len(notifications) == 3
 
+    def test_send_notifications_by_filter_task(self, db_session):
+        """Test that category followers are notified once each, in chunks."""
+        users = [
+            User(email=f"user{i}@example.com", username=f"user{i}", full_name=f"User {i}")
+            for i in range(4)
+        ]
+        categories = [
+            Category(name="Python", slug="python"),
+            Category(name="Rust", slug="rust"),
+        ]
+        db_session.add_all(users + categories)
+        db_session.flush()
+        author, *followers = users
+        # Every user follows both categories; the author is excluded
+        db_session.add_all([
+            UserFollow(user_id=user.id, category_id=category.id)
+            for user in users
+            for category in categories
+        ])
+        db_session.flush()
+        follower_ids = {user.id for user in followers}
+
+        # A chunk size of 2 makes the task page through the followers
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications.FILTER_FANOUT_CHUNK_SIZE", 2):
+            result = send_notifications_by_filter_task.run(
+                filter_spec={
+                    "category_ids": [str(category.id) for category in categories],
+                    "exclude_user_ids": [str(author.id)],
+                },
+                notification_type=NotificationType.NEW_PROMPT.value,
+                message="Filter test notification",
+            )
+
+        assert result["created"] == 3
+        notified = [
+            row.user_id
+            for row in db_session.query(Notification.user_id).filter(
+                Notification.message == "Filter test notification"
+            )
+        ]
+        assert sorted(notified) == sorted(follower_ids)
+
+    def test_send_bulk_notifications_task_statement_count(self, db_session):
+        """Test that the bulk task validates and inserts with one statement each."""
+        users = [
+            User(email=f"user{i}@example.com", username=f"user{i}", full_name=f"User {i}")
+            for i in range(5)
+        ]
+        db_session.add_all(users)
+        db_session.flush()
+        user_ids = [str(user.id) for user in users]
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            if not statement.startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+                statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", record_statement)
+        try:
+            with patch("src.tasks.notifications._session", return_value=db_session):
+                result = send_bulk_notifications_task.run(
+                    user_ids=user_ids,
+                    notification_type=NotificationType.NEW_PROMPT.value,
+                    message="Bulk test notification",
+                )
+        finally:
+            event.remove(connection, "before_cursor_execute", record_statement)
+
+        assert result["created"] == 5
+        assert len(statements) == 2
+        assert statements[0].startswith("SELECT")
+        assert statements[1].startswith("INSERT")
+
+    def test_send_bulk_notifications_task_with_email(self, db_session):
+        """Test that bulk emails are sent concurrently and failures are reported."""
+        users = [
+            User(email=f"user{i}@example.com", username=f"user{i}", full_name=f"User {i}")
+            for i in range(3)
+        ]
+        db_session.add_all(users)
+        db_session.flush()
+        user_ids = [str(user.id) for user in users]
+
+        async def send(to_email, **kwargs):
+            if to_email == "user1@example.com":
+                raise ConnectionError("SMTP unavailable")
+
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._EMAIL_ENABLED", True), \
+             patch(
+                 "src.tasks.notifications.EmailService.send_notification_email",
+                 new_callable=AsyncMock,
+                 side_effect=send,
+             ) as mock_email:
+            result = send_bulk_notifications_task.run(
+                user_ids=user_ids,
+                notification_type=NotificationType.NEW_PROMPT.value,
+                message="Bulk test notification",
+                send_email=True,
+            )
+
+        assert result["created"] == 3
+        assert result["email_sent"] == 2
+        assert result["errors"] == [f"Email error for {user_ids[1]}: SMTP unavailable"]
+        assert mock_email.await_count == 3
+
+    def test_send_bulk_notifications_reports_email_timeouts(self, db_session):
+        """Test that a send that times out is reported without failing the task."""
+        users = [
+            User(email=f"user{i}@example.com", username=f"user{i}", full_name=f"User {i}")
+            for i in range(2)
+        ]
+        db_session.add_all(users)
+        db_session.flush()
+        user_ids = [str(user.id) for user in users]
+
+        async def send(to_email, **kwargs):
+            if to_email == "user0@example.com":
+                await asyncio.sleep(10)
+
+        with patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._EMAIL_ENABLED", True), \
+             patch("src.tasks.notifications.EMAIL_SEND_TIMEOUT", 0.05), \
+             patch(
+                 "src.tasks.notifications.EmailService.send_notification_email",
+                 new_callable=AsyncMock,
+                 side_effect=send,
+             ):
+            result = send_bulk_notifications_task.run(
+                user_ids=user_ids,
+                notification_type=NotificationType.NEW_PROMPT.value,
+                message="Bulk test notification",
+                send_email=True,
+            )
+
+        assert result["created"] == 2
+        assert result["email_sent"] == 1
+        assert len(result["errors"]) == 1
+        assert result["errors"][0].startswith(f"Email error for {user_ids[0]}")
+
     def test_send_bulk_notifications_with_invalid_user(self, db_session):
         """Test bulk notification task with invalid user IDs."""
         # Create one valid user
@@ -142,8 +494,8 @@ class TestNotificationTasks:
         # Mix valid and invalid user IDs
         user_ids = [str(user.id), str(uuid4())]
 
-        # Patch SessionLocal to use test db_session
-        with patch("src.tasks.notifications.SessionLocal", return_value=db_session):
+        # Patch the thread-cached session to use test db_session
+        with patch("src.tasks.notifications._session", return_value=db_session):
             result = send_bulk_notifications_task.run(
                 user_ids=user_ids,
                 notification_type=NotificationType.NEW_PROMPT.value,
@@ -157,8 +509,27 @@ class TestNotificationTasks:
         assert result["failed"] == 1
         assert len(result["errors"]) == 1
 
+    def test_send_bulk_notifications_with_malformed_user_id(self):
+        """Test that malformed user IDs are rejected without touching the database."""
+        mock_db = MagicMock()
+
+        with patch("src.tasks.notifications._session", return_value=mock_db):
+            result = send_bulk_notifications_task.run(
+                user_ids=["not-a-uuid", "1234"],
+                notification_type=NotificationType.NEW_PROMPT.value,
+                message="Test notification",
+                prompt_id=None,
+                send_email=False,
+            )
+
+        assert result["created"] == 0
+        assert result["failed"] == 2
+        assert result["errors"][0].startswith("Error for not-a-uuid:")
+        mock_db.query.assert_not_called()
+        mock_db.execute.assert_not_called()
+
     def test_send_notification_task_retry_on_failure(self, db_session):
-        """Test that task retries on failure."""
+        """Test that invalid input fails the task instead of being retried."""
         # Create user
         user = User(
             email="test@example.com",
@@ -179,7 +550,7 @@ class TestNotificationTasks:
                 raise Exception("Retry called")
 
         # Simulate failure by passing invalid notification type
-        with patch("src.tasks.notifications.SessionLocal", return_value=db_session):
+        with patch("src.tasks.notifications._session", return_value=db_session):
             with pytest.raises(ValueError):
                 send_notification_task.run(
                     user_id=str(user.id),
@@ -192,3 +563,136 @@ class TestNotificationTasks:
         # In real Celery, retry would be called
         # Here we just verify the exception is raised
 
+    def test_batch_flush_collapses_events(self, db_session, redis_client):
+        """Test that a burst of batchable events becomes one row and one email."""
+        user = User(
+            email="batch@example.com",
+            username="batchuser",
+            full_name="Batch User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        # The task closes the session, which detaches the user
+        user_id = user.id
+
+        with patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch("src.tasks.notifications._session", return_value=db_session), \
+             patch("src.tasks.notifications._EMAIL_ENABLED", True), \
+             patch(
+                 "src.tasks.notifications.EmailService.send_notification_email",
+                 new_callable=AsyncMock,
+             ) as mock_email:
+            for i in range(10):
+                result = send_notification_task.run(
+                    user_id=str(user_id),
+                    notification_type=NotificationType.COMMENT.value,
+                    message=f"New comment {i}",
+                    send_email=True,
+                )
+                assert result["status"] == "batched"
+
+            results = flush_notification_batches_task.run()
+
+        assert results["batches"] == 1
+        assert results["events"] == 10
+        notifications = db_session.query(Notification).filter(
+            Notification.user_id == user_id
+        ).all()
+        assert len(notifications) == 1
+        assert "10 new notifications" in notifications[0].message
+        assert mock_email.call_count == 1
+
+    def test_batch_redelivered_task_is_not_queued_twice(self, db_session, redis_client):
+        """Test that re-running a batched task with the same ID adds one event."""
+        user_id = str(uuid4())
+
+        send_notification_task.push_request(id="redelivered-task-id")
+        try:
+            with patch("src.tasks.notifications._redis", return_value=redis_client):
+                for _ in range(2):
+                    send_notification_task.run(
+                        user_id=user_id,
+                        notification_type=NotificationType.COMMENT.value,
+                        message="New comment",
+                        send_email=True,
+                    )
+        finally:
+            send_notification_task.pop_request()
+
+        key = f"notif:batch:{user_id}:{NotificationType.COMMENT.value}"
+        assert redis_client.zcard(key) == 1
+
+    def test_batch_rejects_malformed_user_id(self, redis_client):
+        """Test that a malformed user ID is rejected before reaching Redis."""
+        with patch("src.tasks.notifications._redis", return_value=redis_client):
+            with pytest.raises(ValueError):
+                send_notification_task.run(
+                    user_id="not-a-uuid",
+                    notification_type=NotificationType.COMMENT.value,
+                    message="New comment",
+                    send_email=True,
+                )
+
+        assert redis_client.smembers("notif:batch:keys") == set()
+
+    def test_batch_flush_keeps_events_when_write_fails(self, db_session, redis_client):
+        """Test that events stay queued when the digest insert fails."""
+        user = User(
+            email="batch@example.com",
+            username="batchuser",
+            full_name="Batch User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_id = user.id
+        key = f"notif:batch:{user_id}:{NotificationType.COMMENT.value}"
+
+        with patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch("src.tasks.notifications._session", return_value=db_session):
+            for i in range(3):
+                send_notification_task.run(
+                    user_id=str(user_id),
+                    notification_type=NotificationType.COMMENT.value,
+                    message=f"New comment {i}",
+                    send_email=True,
+                )
+
+            with patch.object(db_session, "commit", side_effect=RuntimeError("database down")):
+                with pytest.raises(RuntimeError):
+                    flush_notification_batches_task.run()
+
+        assert redis_client.zcard(key) == 3
+
+    def test_batch_flush_skips_bad_events(self, db_session, redis_client):
+        """Test that unparseable events are discarded without losing the rest."""
+        user = User(
+            email="batch@example.com",
+            username="batchuser",
+            full_name="Batch User",
+        )
+        db_session.add(user)
+        db_session.flush()
+        user_id = user.id
+        key = f"notif:batch:{user_id}:{NotificationType.COMMENT.value}"
+
+        with patch("src.tasks.notifications._redis", return_value=redis_client), \
+             patch("src.tasks.notifications._session", return_value=db_session):
+            send_notification_task.run(
+                user_id=str(user_id),
+                notification_type=NotificationType.COMMENT.value,
+                message="New comment",
+                send_email=True,
+            )
+            redis_client.zadd(key, {"not json": 0})
+            redis_client.zadd("notif:batch:not-a-uuid:comment", {"{}": 0})
+            redis_client.sadd("notif:batch:keys", "notif:batch:not-a-uuid:comment")
+
+            results = flush_notification_batches_task.run()
+
+        assert results["batches"] == 1
+        assert len(results["errors"]) == 2
+        assert redis_client.smembers("notif:batch:keys") == set()
+        notifications = db_session.query(Notification).filter(
+            Notification.user_id == user_id
+        ).all()
+        assert [n.message for n in notifications] == ["New comment"]